@@ -1,10 +1,11 @@
 """
 Main entry point for the Telegram Deleted Messages Manager application.
-"""
-
-import flet as ft
 
-from src.ui.app import main
+Thin wrapper kept at the project root for PyInstaller and
+``python main.py``; the real entry point lives in src.main.
+"""
 
 if __name__ == "__main__":
-    ft.app(target=main)
+    from src.main import main
+
+    main()
@@ -2,9 +2,16 @@
 Main entry point for the Telegram Deleted Messages Manager application.
 """
 
-import flet as ft
 
-from ui.app import main
+def main() -> None:
+    """Launch the Flet application.
 
-if __name__ == "__main__":
-    ft.app(target=main)
+    Imports are deferred so the PyInstaller bootloader (and plain
+    ``python main.py``) doesn't pay the full flet/telethon import graph
+    before the entry point actually runs.
+    """
+    import flet as ft
+
+    from .ui.app import main as app_main
+
+    ft.app(target=app_main)
@@ -3,15 +3,40 @@ Chat data models.
 """
 
 from datetime import datetime
+from functools import cache
 from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Built once at import time; chat_type_display is hit on every model_dump,
+# so avoid rebuilding a throwaway dict per access.
+_CHAT_TYPE_DISPLAY: dict[str, str] = {
+    "channel": "Channel",
+    "group": "Group",
+    "supergroup": "Supergroup",
+    "user": "User",
+    "chat": "Chat",
+}
+
+
+@cache
+def _chat_type_display(chat_type: str) -> str:
+    """Human-readable label for a chat type (cached per value).
+
+    Only a handful of values ever occur, so the cache reaches steady
+    state immediately and every later call is a C-level lookup.
+    """
+    return _CHAT_TYPE_DISPLAY.get(chat_type, chat_type.capitalize())
 
 
 class ChatInfo(BaseModel):
     """Information about a Telegram chat."""
 
-    model_config = ConfigDict(ser_json_timedelta="iso8601")
+    # Chat rows are built once and only read afterwards; frozen lets
+    # pydantic-core skip its assignment/revalidation paths entirely.
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", ser_json_timedelta="iso8601"
+    )
 
     chat_id: int
     title: str
@@ -21,7 +46,6 @@ class ChatInfo(BaseModel):
     description: Optional[str] = None
     last_message_date: Optional[datetime] = None
 
-    @computed_field
     @property
     def display_name(self) -> str:
         """Get display name for the chat."""
@@ -29,18 +53,10 @@ class ChatInfo(BaseModel):
             return f"{self.title} (@{self.username})"
         return self.title
 
-    @computed_field
     @property
     def chat_type_display(self) -> str:
         """Get human-readable chat type."""
-        type_map = {
-            "channel": "Channel",
-            "group": "Group",
-            "supergroup": "Supergroup",
-            "user": "User",
-            "chat": "Chat",
-        }
-        return type_map.get(self.chat_type, self.chat_type.capitalize())
+        return _chat_type_display(self.chat_type)
 
     def __str__(self) -> str:
         """String representation."""
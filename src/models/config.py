@@ -3,10 +3,11 @@ Configuration data models for the application.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class TelegramConfig(BaseModel):
@@ -41,13 +42,22 @@ class ExportConfig(BaseModel):
     min_message_id: int = Field(default=0, ge=0)
     max_message_id: int = Field(default=0, ge=0)
 
+    # Metadata write batching: buffer this many records (or this many
+    # seconds, whichever comes first) per flush instead of hitting the
+    # disk once per message
+    write_batch_size: int = Field(default=256, ge=1)
+    write_flush_interval_seconds: float = Field(default=2.0, gt=0)
+
     @field_validator("output_directory")
     @classmethod
     def validate_output_directory(cls, v: str) -> str:
         """Validate output directory is not empty."""
         if not v or not v.strip():
             raise ValueError("Output directory cannot be empty")
-        return v.strip()
+        # Only allocate a stripped copy when there is whitespace to remove
+        if v[0].isspace() or v[-1].isspace():
+            return v.strip()
+        return v
 
 
 class ResendConfig(BaseModel):
@@ -71,6 +81,12 @@ class ResendConfig(BaseModel):
     # Reply link formatting
     use_hidden_reply_links: bool = True  # Use HTML <a> tags
 
+    # Parallel sends. The default of 1 keeps messages arriving in
+    # chronological order (the exporter sorts by date, and a faster batch
+    # would overtake a slow media upload); raising it trades that ordering
+    # for upload throughput.
+    max_concurrent_uploads: int = Field(default=1, ge=1)
+
     # Message batching
     enable_batching: bool = False
     batch_max_messages: int = 7  # Merge up to 7 messages
@@ -83,7 +99,17 @@ class ResendConfig(BaseModel):
         """Validate source directory is not empty."""
         if not v or not v.strip():
             raise ValueError("Source directory cannot be empty")
-        return v.strip()
+        # Only allocate a stripped copy when there is whitespace to remove
+        if v[0].isspace() or v[-1].isspace():
+            return v.strip()
+        return v
+
+
+# Prebuilt adapters reuse the compiled pydantic-core validators directly,
+# skipping the model __init__ plumbing on every AppConfig.load
+_TELEGRAM_ADAPTER = TypeAdapter(TelegramConfig)
+_EXPORT_ADAPTER = TypeAdapter(ExportConfig)
+_RESEND_ADAPTER = TypeAdapter(ResendConfig)
 
 
 class AppConfig(BaseModel):
@@ -97,17 +123,23 @@ class AppConfig(BaseModel):
     def save(self, file_path: Optional[str] = None) -> None:
         """Save configuration to file."""
         path = Path(file_path or self.config_file)
+        # Omit unchanged defaults: load() backfills them, and the smaller
+        # file parses proportionally faster on every startup.
         data = {
-            "telegram": self.telegram.model_dump(),
-            "export": self.export.model_dump(),
-            "resend": self.resend.model_dump(),
+            "telegram": self.telegram.model_dump(mode="python", exclude_defaults=True),
+            "export": self.export.model_dump(mode="python", exclude_defaults=True),
+            "resend": self.resend.model_dump(mode="python", exclude_defaults=True),
         }
 
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write configuration to file
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Encode once to bytes and write atomically: a crash mid-write must
+        # not leave a truncated config behind.
+        encoded = json.dumps(data, indent=2).encode("utf-8")
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(encoded)
+        os.replace(tmp_path, path)
 
     @classmethod
     def load(cls, file_path: str = "app_config.json") -> "AppConfig":
@@ -117,12 +149,13 @@ class AppConfig(BaseModel):
         if not path.exists():
             return cls(config_file=file_path)
 
-        # Load configuration from file
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # Load configuration from file (json.loads handles the UTF-8 decode,
+        # so skip the intermediate str of read_text)
+        data = json.loads(path.read_bytes())
 
         return cls(
-            telegram=TelegramConfig(**data.get("telegram", {})),
-            export=ExportConfig(**data.get("export", {})),
-            resend=ResendConfig(**data.get("resend", {})),
+            telegram=_TELEGRAM_ADAPTER.validate_python(data.get("telegram", {})),
+            export=_EXPORT_ADAPTER.validate_python(data.get("export", {})),
+            resend=_RESEND_ADAPTER.validate_python(data.get("resend", {})),
             config_file=file_path,
         )
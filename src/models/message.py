@@ -2,10 +2,53 @@
 Message data models.
 """
 
+import sys
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, computed_field
+from pydantic import BaseModel, ConfigDict, Field
+
+_UNKNOWN_USER = sys.intern("Unknown User")
+
+# Timezone objects are immutable; build each UTC offset once.
+_TZ_CACHE: dict[int, timezone] = {}
+
+
+def _tz(offset_hours: int) -> timezone:
+    """Get (and cache) a fixed-offset timezone for the given UTC offset."""
+    tz = _TZ_CACHE.get(offset_hours)
+    if tz is None:
+        tz = _TZ_CACHE[offset_hours] = timezone(timedelta(hours=offset_hours))
+    return tz
+
+
+@lru_cache(maxsize=4096)
+def _format_minute(epoch_minute: int, offset_hours: int) -> str:
+    """Format a minute-granularity timestamp for display.
+
+    The format has no seconds, so caching per (minute, offset) makes
+    repeated renders of the same chat window nearly free.
+    """
+    dt = datetime.fromtimestamp(epoch_minute * 60, tz=_tz(offset_hours))
+    return dt.strftime("%Y %b %d, %H:%M")
+
+
+@lru_cache(maxsize=64)
+def _fmt_hms(total_seconds: int) -> str:
+    """Format a duration as '1h 2m 3s' (dropping leading zero units).
+
+    Durations only tick over once a second, so UI polls between ticks
+    hit the cache.
+    """
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    if minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
 
 
 class DeletedMessage(BaseModel):
@@ -40,41 +83,51 @@ class DeletedMessage(BaseModel):
         if not self.date:
             return "Unknown date"
 
-        adjusted_date = self.date + timedelta(hours=timezone_offset_hours)
-        return adjusted_date.strftime("%Y %b %d, %H:%M")
+        # Telethon dates are tz-aware UTC; treat naive dates as UTC too
+        # (matching the previous add-a-timedelta behavior).
+        date = self.date if self.date.tzinfo else self.date.replace(tzinfo=timezone.utc)
+        return _format_minute(int(date.timestamp() // 60), timezone_offset_hours)
 
-    @computed_field
     @property
     def sender_display(self) -> str:
-        """Get display name for sender."""
-        if self.sender_name:
-            if self.sender_username:
-                return f"{self.sender_name} (@{self.sender_username})"
-            return self.sender_name
-        if self.sender_username:
-            return f"@{self.sender_username}"
-        return "Unknown User"
-
-    @computed_field
+        """Get display name for sender.
+
+        A handful of senders dominate any chat export, so the result is
+        interned: identical display strings across thousands of messages
+        share a single object.
+        """
+        name, username = self.sender_name, self.sender_username
+        if name:
+            if username:
+                return sys.intern(f"{name} (@{username})")
+            return sys.intern(name)
+        if username:
+            return sys.intern(f"@{username}")
+        return _UNKNOWN_USER
+
     @property
     def has_text(self) -> bool:
         """Check if message has text content."""
-        return bool(self.text and self.text.strip())
+        # isspace() answers "only whitespace?" without allocating the
+        # stripped copy that strip() would
+        text = self.text
+        return bool(text) and not text.isspace()
 
     def __str__(self) -> str:
         """String representation."""
+        text = self.text
         media_info = f" [Media: {self.media_type}]" if self.has_media else ""
-        text_preview = (
-            self.text[:50] + "..."
-            if self.text and len(self.text) > 50
-            else self.text or ""
-        )
+        text_preview = text[:50] + "..." if text and len(text) > 50 else text or ""
         return f"Message {self.message_id} from {self.sender_display}{media_info}: {text_preview}"
 
 
 class ExportProgress(BaseModel):
     """Track export progress."""
 
+    # Counters are mutated in place during export, so the model stays
+    # unfrozen; forbidding extras keeps the validator on its short path.
+    model_config = ConfigDict(extra="forbid")
+
     total_messages: int = 0
     processed_messages: int = 0
     exported_text_messages: int = 0
@@ -85,8 +138,10 @@ class ExportProgress(BaseModel):
     is_cancelled: bool = False
     error_message: Optional[str] = None
     start_time: Optional[datetime] = None
+    # Monotonic snapshot taken at construction; immune to wall-clock jumps
+    # and much cheaper to diff than datetime.now() on every UI poll.
+    start_monotonic: float = Field(default_factory=time.monotonic)
 
-    @computed_field
     @property
     def progress_percentage(self) -> float:
         """Calculate progress percentage."""
@@ -94,7 +149,6 @@ class ExportProgress(BaseModel):
             return 0.0
         return (self.processed_messages / self.total_messages) * 100
 
-    @computed_field
     @property
     def success_rate(self) -> float:
         """Calculate success rate."""
@@ -103,62 +157,49 @@ class ExportProgress(BaseModel):
         successful = self.processed_messages - self.failed_messages
         return (successful / self.processed_messages) * 100
 
-    @computed_field
     @property
     def elapsed_seconds(self) -> float:
         """Calculate elapsed time in seconds."""
         if not self.start_time:
             return 0.0
-        now = datetime.now(timezone.utc)
-        elapsed = now - self.start_time.replace(tzinfo=timezone.utc)
-        return elapsed.total_seconds()
+        return time.monotonic() - self.start_monotonic
 
-    @computed_field
     @property
-    def estimated_total_seconds(self) -> Optional[float]:
-        """Calculate estimated total time in seconds based on current progress."""
-        if self.processed_messages == 0 or not self.start_time:
+    def _time_snapshot(self) -> Optional[tuple[float, float, float]]:
+        """Compute (elapsed, estimated total, estimated remaining) together.
+
+        One clock read feeds all three values, instead of the estimate
+        and the remainder each re-reading the clock and drifting apart
+        by microseconds.
+        """
+        if not self.start_time:
             return None
-        if self.total_messages == 0:
+        if self.processed_messages == 0 or self.total_messages == 0:
             return None
-        avg_time_per_message = self.elapsed_seconds / self.processed_messages
-        return avg_time_per_message * self.total_messages
+        elapsed = time.monotonic() - self.start_monotonic
+        estimated_total = elapsed / self.processed_messages * self.total_messages
+        return elapsed, estimated_total, max(0.0, estimated_total - elapsed)
+
+    @property
+    def estimated_total_seconds(self) -> Optional[float]:
+        """Calculate estimated total time in seconds based on current progress."""
+        snapshot = self._time_snapshot
+        return snapshot[1] if snapshot else None
 
-    @computed_field
     @property
     def estimated_remaining_seconds(self) -> Optional[float]:
         """Calculate estimated remaining time in seconds."""
-        if not self.estimated_total_seconds:
-            return None
-        remaining = self.estimated_total_seconds - self.elapsed_seconds
-        return max(0.0, remaining)
+        snapshot = self._time_snapshot
+        return snapshot[2] if snapshot else None
 
-    @computed_field
     @property
     def formatted_elapsed_time(self) -> str:
         """Get formatted elapsed time string (HH:MM:SS)."""
-        elapsed = int(self.elapsed_seconds)
-        hours, remainder = divmod(elapsed, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
-
-    @computed_field
+        return _fmt_hms(int(self.elapsed_seconds))
+
     @property
     def formatted_eta(self) -> str:
         """Get formatted ETA string (HH:MM:SS)."""
         if not self.estimated_remaining_seconds:
             return "Calculating..."
-        remaining = int(self.estimated_remaining_seconds)
-        hours, remainder = divmod(remaining, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        return _fmt_hms(int(self.estimated_remaining_seconds))
@@ -4,16 +4,29 @@ Service for exporting deleted messages from Telegram.
 
 import asyncio
 import json
+import os
 import re
+import time
 from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Awaitable, Callable, List, Optional
 
+from telethon import utils as telethon_utils
 from telethon.errors import FloodWaitError, RPCError
-from telethon.tl.types import Channel, Message, PeerChannel, PeerChat, PeerUser, User
+from telethon.tl.types import (
+    Channel,
+    Message,
+    MessageMediaDocument,
+    MessageMediaPhoto,
+    PeerChannel,
+    PeerChat,
+    PeerUser,
+    User,
+)
 
 from ..models.config import ExportConfig
-from ..models.message import DeletedMessage, ExportProgress
+from ..models.message import ExportProgress
 from ..utils.logger import get_logger
 from .telegram_service import TelegramService
 
@@ -22,11 +35,90 @@ ProgressCallback = Callable[[ExportProgress], Awaitable[None]]
 
 # Constants
 MAX_PARALLEL_DOWNLOADS = 4
-ADMIN_LOG_BATCH_SIZE = 100
+# Telethon pages channels.getAdminLog at 100 events per RPC internally and
+# exposes no larger page size; these constants only shape the local
+# pipeline around that paging.
+EVENT_QUEUE_SIZE = 2000  # producer/consumer buffer between paging and extraction
+MIN_SHARD_SPAN = 1000  # smallest per-shard ID span worth a dedicated producer
+ADMIN_LOG_SHARDS = 4  # concurrent producers when an explicit ID range is set
 MAX_DOWNLOAD_RETRIES = 3
 MAX_METADATA_RETRIES = 3
 RETRY_BACKOFF_BASE = 1  # seconds
 CHUNK_SIZE = 500  # Process media downloads in chunks to manage memory
+LARGE_FILE_THRESHOLD = 1_000_000  # bytes; fetch bigger files with max part size
+PROGRESS_EMIT_INTERVAL = 0.1  # seconds between progress callback invocations
+
+# Characters that are invalid in folder names; compiled once at import
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Peer-type dispatch: (sender_id getter, is a user sender). One dict
+# lookup on the exact type replaces an isinstance chain per message.
+_PEER_HANDLERS = {
+    PeerUser: (attrgetter("user_id"), True),
+    PeerChannel: (attrgetter("channel_id"), False),
+    PeerChat: (attrgetter("chat_id"), False),
+}
+
+
+def _make_event_filter(export_mode: str) -> Callable[[Message], bool]:
+    """
+    Build the message predicate for an export mode.
+
+    The mode is constant for a whole export, so the branch is resolved
+    once here and the hot loop calls a specialized predicate; rejected
+    messages never enter the retry wrapper.
+
+    Args:
+        export_mode: One of "all", "media_only", "text_only"
+
+    Returns:
+        Predicate deciding whether a deleted message should be exported
+    """
+    if export_mode == "media_only":
+        return lambda m: m.media is not None
+    if export_mode == "text_only":
+        return lambda m: bool(m.message) and m.media is None
+    return lambda m: True
+
+
+def _write_final_metadata(
+    ndjson_file: Path,
+    metadata_file: Path,
+    media_patches: dict[int, str],
+    sender_info: dict[int, tuple[Optional[str], Optional[str]]],
+) -> None:
+    """
+    Merge the NDJSON record stream into the final metadata file.
+
+    Replays the records written during extraction, fills in media file
+    paths and resolved sender details, sorts by date (oldest first) and
+    writes messages_metadata.json through a buffered handle.
+
+    Args:
+        ndjson_file: NDJSON file produced during extraction
+        metadata_file: Final JSON file to write
+        media_patches: Mapping of message_id to downloaded media path
+        sender_info: Mapping of sender_id to (name, username)
+    """
+    messages_data = []
+    with ndjson_file.open("r", encoding="utf-8", buffering=1 << 20) as ndjson_in:
+        for line in ndjson_in:
+            record = json.loads(line)
+            media_path = media_patches.get(record["message_id"])
+            if media_path:
+                record["media_file_path"] = media_path
+            info = sender_info.get(record["sender_id"])
+            if info:
+                record["sender_name"], record["sender_username"] = info
+            messages_data.append(record)
+    # Message IDs are monotonic per chat, so id order is chronological
+    # order; itemgetter keys at C level without a Python lambda call
+    # per element.
+    messages_data.sort(key=itemgetter("message_id"))
+    # Stream through a buffered handle instead of building the whole
+    # document as one giant string first
+    with metadata_file.open("w", encoding="utf-8", buffering=1 << 20) as fp:
+        json.dump(messages_data, fp, indent=2, ensure_ascii=False)
 
 
 class ExportService:
@@ -41,7 +133,11 @@ class ExportService:
         """
         self.telegram_service = telegram_service
         self._current_progress: Optional[ExportProgress] = None
-        self._progress_lock = asyncio.Lock()
+        # Monotonic deadline shared by all download workers: when Telegram
+        # answers with a flood wait, every worker backs off until it passes
+        # instead of each tripping the limit in turn.
+        self._flood_wait_until = 0.0
+        self._last_progress_emit = 0.0
 
     @property
     def current_progress(self) -> Optional[ExportProgress]:
@@ -60,7 +156,7 @@ class ExportService:
             Sanitized folder name
         """
         # Remove or replace invalid characters for folder names
-        sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
+        sanitized = _INVALID_CHARS_RE.sub("_", name)
         # Remove leading/trailing spaces and dots
         sanitized = sanitized.strip(". ")
         # Limit length to 100 characters
@@ -72,16 +168,29 @@ class ExportService:
         self, callback: Optional[ProgressCallback], progress: ExportProgress
     ) -> None:
         """
-        Safely call progress callback.
+        Safely call progress callback, coalescing bursts of updates.
+
+        Intermediate updates are emitted at most every
+        PROGRESS_EMIT_INTERVAL seconds so a slow UI callback never
+        serializes the download workers; the final update (complete or
+        errored) always goes through.
 
         Args:
             callback: Progress callback function
             progress: Progress object to pass to callback
         """
-        if callback:
-            result = callback(progress)
-            if asyncio.iscoroutine(result):
-                await result
+        if not callback:
+            return
+        now = time.monotonic()
+        if (
+            not progress.is_complete
+            and now - self._last_progress_emit < PROGRESS_EMIT_INTERVAL
+        ):
+            return
+        self._last_progress_emit = now
+        result = callback(progress)
+        if asyncio.iscoroutine(result):
+            await result
 
     async def export_deleted_messages(
         self,
@@ -136,85 +245,166 @@ class ExportService:
             base_dir = Path(config.output_directory)
             chat_folder = self._sanitize_folder_name(chat_title, config.chat_id)
             output_dir = base_dir / chat_folder
-            output_dir.mkdir(parents=True, exist_ok=True)
+            # mkdir is a blocking syscall; keep it off the event loop
+            await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
             logger.info(f"Created output directory: {output_dir}")
 
             # Prepare metadata file using Path
             metadata_file = output_dir / "messages_metadata.json"
-            messages_dict: dict[
-                int, dict
-            ] = {}  # message_id -> message_data for O(1) lookups
+            # Downloads build their target paths with plain string
+            # formatting; one str() here avoids a pair of PurePath
+            # allocations per downloaded file.
+            output_dir_str = str(output_dir)
+
+            # Records are streamed to NDJSON as they are extracted instead
+            # of being accumulated in memory; media file paths arrive later
+            # (downloads are async), so they go into a small patch table
+            # keyed by message_id and are merged into the final file.
+            ndjson_file = metadata_file.with_suffix(".ndjson")
+            media_patches: dict[int, str] = {}  # message_id -> media file path
+            # User senders are resolved in one batch after extraction, so
+            # the hot loop never awaits an entity lookup per message
+            unique_senders: set[int] = set()
+            ndjson_fp = ndjson_file.open("w", encoding="utf-8", buffering=1 << 20)
+            records_written = 0
+            last_flush = time.monotonic()
+
+            def write_record(record: dict) -> None:
+                """Append one metadata record, flushing on the configured cadence."""
+                nonlocal records_written, last_flush
+                ndjson_fp.write(json.dumps(record, ensure_ascii=False))
+                ndjson_fp.write("\n")
+                records_written += 1
+                now = time.monotonic()
+                if (
+                    records_written % config.write_batch_size == 0
+                    or now - last_flush >= config.write_flush_interval_seconds
+                ):
+                    ndjson_fp.flush()
+                    last_flush = now
 
             # PHASE 1: Fast metadata extraction
-            # Iterate through admin log and collect all messages with metadata
-            limit_per_batch = ADMIN_LOG_BATCH_SIZE
-            current_max_id = config.max_message_id or 0
-            messages_with_media = []  # Store (raw_message, deleted_msg, output_dir)
-
-            logger.info("Phase 1: Extracting metadata from admin log")
-            while True:
-                logger.debug(f"Fetching admin log batch (max_id={current_max_id})")
-                events = [
-                    event
-                    async for event in self.telegram_service.client.iter_admin_log(
-                        chat_entity,
-                        min_id=config.min_message_id or 0,
-                        max_id=current_max_id or 0,
-                        limit=limit_per_batch,
-                        delete=True,
-                    )
-                ]
-
-                if not events:
-                    logger.debug("No more events found")
-                    break
+            # Producer drains the admin log while the consumer extracts
+            # metadata, so Telegram round-trips overlap with local
+            # processing instead of stalling between batches.
+            event_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+            # Media downloads run concurrently with metadata extraction:
+            # a bounded queue feeds a fixed pool of worker tasks, so the
+            # first download starts as soon as the first media message is
+            # identified instead of after the whole admin-log scan.
+            download_queue: asyncio.Queue = asyncio.Queue(
+                maxsize=MAX_PARALLEL_DOWNLOADS * 4
+            )
 
-                logger.info(
-                    f"Processing {len(events)} deleted message events (metadata)"
-                )
+            async def drain_range(min_id: int, max_id: int) -> None:
+                async for event in self.telegram_service.client.iter_admin_log(
+                    chat_entity,
+                    min_id=min_id,
+                    max_id=max_id,
+                    delete=True,
+                ):
+                    await event_queue.put(event)
 
-                # Extract metadata from each deleted message (fast, no media download)
-                for event in events:
-                    if event.deleted_message and event.old:
-                        result = await self._extract_message_metadata_with_retry(
-                            event.old,
-                            output_dir,
-                            config,
-                            messages_dict,
+            async def produce_events() -> None:
+                try:
+                    min_id = config.min_message_id or 0
+                    max_id = config.max_message_id or 0
+                    span = (max_id - min_id) // ADMIN_LOG_SHARDS if max_id else 0
+                    if min_id and span > MIN_SHARD_SPAN:
+                        # An explicit ID range can be split into disjoint
+                        # shards drained concurrently, overlapping the
+                        # sequential paging round-trips. Bounds are
+                        # exclusive on both ends, hence the +1 stitching.
+                        bounds = [
+                            min_id + span * i for i in range(ADMIN_LOG_SHARDS)
+                        ] + [max_id]
+                        await asyncio.gather(
+                            *(
+                                drain_range(
+                                    bounds[i],
+                                    bounds[i + 1] + 1
+                                    if i < ADMIN_LOG_SHARDS - 1
+                                    else bounds[i + 1],
+                                )
+                                for i in range(ADMIN_LOG_SHARDS)
+                            )
                         )
-                        if result:  # If message has media to download
-                            messages_with_media.append(result)
-
-                # Update max_id for next batch
-                current_max_id = events[-1].id - 1
-
-                if current_max_id < config.min_message_id:
-                    logger.debug("Reached minimum message ID")
-                    break
-
-            # PHASE 2: Parallel media download
-            if messages_with_media:
-                # Set total messages for accurate progress tracking
-                self._current_progress.total_messages = len(messages_with_media)
+                    else:
+                        await drain_range(min_id, max_id)
+                finally:
+                    # Always wake the consumer, even if the iterator failed
+                    await event_queue.put(None)
 
-                logger.info(
-                    f"Phase 2: Downloading media for {len(messages_with_media)} messages "
-                    f"(up to {MAX_PARALLEL_DOWNLOADS} parallel downloads)"
-                )
-                await self._download_media_parallel(
-                    messages_with_media, config, progress_callback
-                )
+            logger.info("Phase 1: Extracting metadata from admin log")
+            should_export = _make_event_filter(config.export_mode)
 
-            # Save metadata (sorted by date, oldest first)
-            if messages_dict:
-                logger.info(f"Saving metadata for {len(messages_dict)} messages")
-                # Convert dict to list and sort messages by date (oldest first)
-                messages_data = list(messages_dict.values())
-                messages_data.sort(key=lambda m: m.get("date") or "")
-                metadata_file.write_text(
-                    json.dumps(messages_data, indent=2, ensure_ascii=False),
-                    encoding="utf-8",
+            # Structured concurrency: producer, consumer and download
+            # workers live in one TaskGroup, so a fatal error in any of
+            # them cancels the rest deterministically instead of leaving
+            # thousands of doomed downloads queued.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    download_workers = [
+                        tg.create_task(
+                            self._download_worker(
+                                download_queue, config, progress_callback
+                            )
+                        )
+                        for _ in range(MAX_PARALLEL_DOWNLOADS)
+                    ]
+                    tg.create_task(produce_events())
+
+                    while (event := await event_queue.get()) is not None:
+                        if (
+                            event.deleted_message
+                            and event.old
+                            and should_export(event.old)
+                        ):
+                            result = await self._extract_message_metadata_with_retry(
+                                event.old,
+                                output_dir_str,
+                                config,
+                                write_record,
+                                media_patches,
+                                unique_senders,
+                            )
+                            if result:  # If message has media to download
+                                self._current_progress.total_messages += 1
+                                await download_queue.put(result)
+
+                    # Drain the worker pool: one sentinel per worker, then
+                    # the TaskGroup waits for in-flight downloads to finish
+                    for _ in download_workers:
+                        await download_queue.put(None)
+            except ExceptionGroup as eg:
+                # A lone failure (e.g. admin log access lost) should reach
+                # the RPCError/Exception handlers below in its original form
+                if len(eg.exceptions) == 1:
+                    raise eg.exceptions[0]
+                raise
+            finally:
+                ndjson_fp.close()
+
+            # Resolve the unique senders in one batch: O(unique senders)
+            # await-hops instead of one per message
+            sender_info = await self._resolve_senders(unique_senders)
+
+            # Save metadata (sorted by date, oldest first): replay the
+            # NDJSON stream, apply media-path and sender patches, then
+            # write the final JSON document. The merge reads and writes
+            # potentially tens of MB, so it runs on a worker thread
+            # instead of stalling the event loop.
+            if records_written:
+                logger.info(f"Saving metadata for {records_written} messages")
+                await asyncio.to_thread(
+                    _write_final_metadata,
+                    ndjson_file,
+                    metadata_file,
+                    media_patches,
+                    sender_info,
                 )
+            ndjson_file.unlink(missing_ok=True)
 
             # Mark as complete
             self._current_progress.is_complete = True
@@ -249,38 +439,61 @@ class ExportService:
 
         return self._current_progress
 
-    async def _download_media_parallel(
+    async def _resolve_senders(
+        self, sender_ids: set[int]
+    ) -> dict[int, tuple[Optional[str], Optional[str]]]:
+        """
+        Resolve user senders to (name, username) pairs in one batch.
+
+        Args:
+            sender_ids: Unique user IDs collected during extraction
+
+        Returns:
+            Mapping of sender_id to (sender_name, sender_username);
+            senders that could not be resolved are omitted
+        """
+        if not sender_ids:
+            return {}
+
+        logger.info(f"Resolving {len(sender_ids)} unique senders")
+        ids = list(sender_ids)
+        entities = await asyncio.gather(
+            *(self.telegram_service.get_entity_cached(sid) for sid in ids),
+            return_exceptions=True,
+        )
+
+        sender_info: dict[int, tuple[Optional[str], Optional[str]]] = {}
+        for sid, entity in zip(ids, entities):
+            if isinstance(entity, User):
+                name = " ".join(filter(None, [entity.first_name, entity.last_name]))
+                sender_info[sid] = (name or None, entity.username)
+            elif isinstance(entity, Exception):
+                logger.debug(f"Could not fetch user info for {sid}: {entity}")
+        return sender_info
+
+    async def _download_worker(
         self,
-        messages_with_media: List[tuple],
+        queue: asyncio.Queue,
         config: ExportConfig,
         progress_callback: Optional[ProgressCallback],
     ) -> None:
         """
-        Download media for multiple messages in parallel.
+        Consume media download items from the queue until a None sentinel.
 
         Args:
-            messages_with_media: List of (raw_message, deleted_msg, output_dir, messages_dict) tuples
+            queue: Queue of (message_id, media, file_size, output_dir_str, media_patches) tuples
             config: Export configuration
             progress_callback: Optional progress callback
         """
-        semaphore = asyncio.Semaphore(MAX_PARALLEL_DOWNLOADS)
-
-        async def download_with_semaphore(item: tuple):
-            async with semaphore:
+        while (item := await queue.get()) is not None:
+            try:
                 await self._download_single_media(item, config, progress_callback)
-
-        # Download all media in parallel
-        results = await asyncio.gather(
-            *[download_with_semaphore(item) for item in messages_with_media],
-            return_exceptions=True,
-        )
-
-        # Log any exceptions that occurred during parallel downloads
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
+            except Exception as e:
+                # _download_single_media handles expected failures itself;
+                # anything escaping here is logged so the worker keeps going
                 logger.error(
-                    f"Failed to download media for message at index {i}: {result}",
-                    exc_info=result,
+                    f"Failed to download media for message {item[0]}: {e}",
+                    exc_info=e,
                 )
 
     async def _download_single_media(
@@ -293,56 +506,75 @@ class ExportService:
         Download media for a single message with retry logic.
 
         Args:
-            item: Tuple of (raw_message, deleted_msg, output_dir, messages_dict)
+            item: Tuple of (message_id, media, file_size, output_dir_str, media_patches)
             config: Export configuration
             progress_callback: Optional progress callback
         """
-        raw_message, deleted_msg, output_dir, messages_dict = item
-        message_id = raw_message.id
+        message_id, media, file_size, output_dir_str, media_patches = item
 
-        media_path = output_dir / str(message_id)
+        media_path = f"{output_dir_str}{os.sep}{message_id}"
         max_retries = MAX_DOWNLOAD_RETRIES
         retry_count = 0
 
-        # Update progress (thread-safe)
-        async with self._progress_lock:
-            self._current_progress.processed_messages += 1
-            self._current_progress.current_message_id = message_id
+        # Plain += is safe here: the event loop is single-threaded and
+        # no await happens between the read and the write
+        self._current_progress.processed_messages += 1
+        self._current_progress.current_message_id = message_id
 
         while retry_count < max_retries:
             try:
+                # Honor an active flood-wait deadline set by any worker
+                delay = self._flood_wait_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
                 logger.debug(f"Downloading media for message {message_id}")
-                downloaded_path = await self.telegram_service.client.download_media(
-                    raw_message.media, file=str(media_path)
-                )
+                if (
+                    file_size
+                    and file_size > LARGE_FILE_THRESHOLD
+                    and isinstance(media, (MessageMediaDocument, MessageMediaPhoto))
+                ):
+                    # Large documents/photos: download_file with the
+                    # maximum 512 KB part size halves the round trips of
+                    # the download_media default. Other media (e.g.
+                    # MessageMediaWebPage) cannot be cast to an input
+                    # location, so they take the download_media path below.
+                    large_path = media_path + telethon_utils.get_extension(media)
+                    await self.telegram_service.client.download_file(
+                        media, file=large_path, part_size_kb=512
+                    )
+                    downloaded_path = large_path
+                else:
+                    downloaded_path = (
+                        await self.telegram_service.client.download_media(
+                            media, file=media_path
+                        )
+                    )
 
                 # Handle None return from download_media
                 if downloaded_path:
-                    # Verify file exists and has content
-                    downloaded_file = Path(downloaded_path)
-                    if downloaded_file.exists() and downloaded_file.stat().st_size > 0:
-                        deleted_msg.media_file_path = str(downloaded_path)
-
-                        # Update progress (thread-safe)
-                        async with self._progress_lock:
-                            self._current_progress.exported_media_messages += 1
+                    # Verify file exists and has content: one stat() call,
+                    # with FileNotFoundError standing in for exists()
+                    try:
+                        file_size_on_disk = os.stat(downloaded_path).st_size
+                    except FileNotFoundError:
+                        file_size_on_disk = 0
+                    if file_size_on_disk > 0:
+                        self._current_progress.exported_media_messages += 1
 
                         logger.debug(
                             f"Media downloaded to: {downloaded_path} "
-                            f"({downloaded_file.stat().st_size} bytes)"
+                            f"({file_size_on_disk} bytes)"
                         )
 
-                        # Update metadata with media file path (O(1) dict lookup)
-                        if message_id in messages_dict:
-                            messages_dict[message_id]["media_file_path"] = str(
-                                downloaded_path
-                            )
+                        # Record the media file path; merged into the final
+                        # metadata when the NDJSON stream is replayed
+                        media_patches[message_id] = str(downloaded_path)
                     else:
                         logger.warning(
                             f"Downloaded file is empty or missing for message {message_id}: {downloaded_path}"
                         )
-                        async with self._progress_lock:
-                            self._current_progress.failed_messages += 1
+                        self._current_progress.failed_messages += 1
                 else:
                     logger.warning(
                         f"download_media returned None for message {message_id}"
@@ -351,6 +583,11 @@ class ExportService:
 
             except FloodWaitError as e:
                 retry_count += 1
+                # Publish the deadline so sibling workers stop hammering
+                # the same rate limit
+                self._flood_wait_until = max(
+                    self._flood_wait_until, time.monotonic() + e.seconds
+                )
                 logger.warning(
                     f"Rate limit hit while downloading media for message {message_id}. "
                     f"Telegram requires waiting {e.seconds} seconds. "
@@ -363,14 +600,12 @@ class ExportService:
                     logger.error(
                         f"Max retries reached for message {message_id} after rate limiting"
                     )
-                    async with self._progress_lock:
-                        self._current_progress.failed_messages += 1
+                    self._current_progress.failed_messages += 1
                     break
 
             except Exception as e:
                 logger.error(f"Failed to download media for message {message_id}: {e}")
-                async with self._progress_lock:
-                    self._current_progress.failed_messages += 1
+                self._current_progress.failed_messages += 1
                 break
 
         # Call progress callback
@@ -379,18 +614,22 @@ class ExportService:
     async def _extract_message_metadata_with_retry(
         self,
         raw_message,
-        output_dir: Path,
+        output_dir_str: str,
         config: ExportConfig,
-        messages_dict: dict[int, dict],
+        write_record: Callable[[dict], None],
+        media_patches: dict[int, str],
+        unique_senders: set[int],
     ) -> Optional[tuple]:
         """
         Extract metadata with retry logic for transient failures.
 
         Args:
             raw_message: Raw message object from Telethon
-            output_dir: Output directory Path
+            output_dir_str: Output directory as a string
             config: Export configuration
-            messages_dict: Dictionary to store message metadata
+            write_record: Writer appending one metadata record to the NDJSON stream
+            media_patches: Patch table mapping message_id to downloaded media path
+            unique_senders: Set collecting user sender IDs for batch resolution
 
         Returns:
             Tuple if message has media to download, None otherwise
@@ -400,7 +639,12 @@ class ExportService:
         for attempt in range(MAX_METADATA_RETRIES):
             try:
                 return await self._extract_message_metadata(
-                    raw_message, output_dir, config, messages_dict
+                    raw_message,
+                    output_dir_str,
+                    config,
+                    write_record,
+                    media_patches,
+                    unique_senders,
                 )
             except Exception as e:
                 if attempt == MAX_METADATA_RETRIES - 1:
@@ -410,8 +654,7 @@ class ExportService:
                         f"after {MAX_METADATA_RETRIES} attempts: {e}",
                         exc_info=True,
                     )
-                    async with self._progress_lock:
-                        self._current_progress.failed_messages += 1
+                    self._current_progress.failed_messages += 1
                     return None
                 else:
                     # Retry with exponential backoff
@@ -424,52 +667,58 @@ class ExportService:
     async def _extract_message_metadata(
         self,
         raw_message,
-        output_dir: Path,
+        output_dir_str: str,
         config: ExportConfig,
-        messages_dict: dict[int, dict],
+        write_record: Callable[[dict], None],
+        media_patches: dict[int, str],
+        unique_senders: set[int],
     ) -> Optional[tuple]:
         """
         Extract metadata from a deleted message (fast, no media download).
 
         Args:
             raw_message: Raw message object from Telethon
-            output_dir: Output directory Path
+            output_dir_str: Output directory as a string
             config: Export configuration
-            messages_dict: Dictionary to store message metadata (message_id -> data)
+            write_record: Writer appending one metadata record to the NDJSON stream
+            media_patches: Patch table mapping message_id to downloaded media path
+            unique_senders: Set collecting user sender IDs for batch resolution
 
         Returns:
-            Tuple (raw_message, deleted_msg, output_dir, messages_dict) if message has media to download, None otherwise
+            Tuple (message_id, media, file_size, output_dir_str, media_patches) if message has media to download, None otherwise
         """
         message_id = raw_message.id
         has_media = raw_message.media is not None
         has_text = bool(raw_message.message)
 
-        # Check export mode
-        should_export = (
-            config.export_mode == "all"
-            or (config.export_mode == "media_only" and has_media)
-            or (config.export_mode == "text_only" and has_text and not has_media)
-        )
-
-        if not should_export:
-            return None
-
+        # Export-mode filtering already happened in the admin-log loop via
+        # the precomputed predicate; everything arriving here is wanted.
         try:
             # Extract message data (metadata only, no media download)
             logger.debug(f"Extracting metadata for message {message_id}")
-            deleted_msg = await self._extract_message_data(raw_message, config.chat_id)
+            record = self._extract_message_data(
+                raw_message, config.chat_id, unique_senders
+            )
 
-            # Count text messages (thread-safe)
+            # Count text messages
             if has_text:
-                async with self._progress_lock:
-                    self._current_progress.exported_text_messages += 1
+                self._current_progress.exported_text_messages += 1
 
-            # Add to metadata dictionary (use Pydantic model_dump instead of to_dict)
-            messages_dict[message_id] = deleted_msg.model_dump(mode="json")
+            # Stream the record out immediately
+            write_record(record)
 
-            # Return info for media download if needed
+            # Return info for media download if needed. Only the id, the
+            # media descriptor and its size are kept: retaining the full
+            # Telethon Message per queued download would pin a large
+            # object graph for the lifetime of the queue.
             if has_media and config.export_mode in {"all", "media_only"}:
-                return (raw_message, deleted_msg, output_dir, messages_dict)
+                return (
+                    message_id,
+                    raw_message.media,
+                    getattr(raw_message.file, "size", None),
+                    output_dir_str,
+                    media_patches,
+                )
 
             return None
 
@@ -478,42 +727,44 @@ class ExportService:
             logger.debug(f"Error extracting metadata for message {message_id}: {e}")
             raise
 
-    async def _extract_message_data(
-        self, raw_message: Message, chat_id: int
-    ) -> DeletedMessage:
+    def _extract_message_data(
+        self, raw_message: Message, chat_id: int, unique_senders: set[int]
+    ) -> dict:
         """
         Extract data from raw Telegram message.
 
+        Returns a plain dict in the DeletedMessage JSON schema rather than
+        the model itself: model_dump(mode="json") walks and coerces every
+        field, which is pure overhead on this sequential hot path. The
+        DeletedMessage model stays the source of truth at the boundaries
+        (resend-side loading validates against it).
+
+        Sender name/username are left unresolved here; user IDs are
+        collected into ``unique_senders`` and filled in after extraction
+        by a single batched lookup.
+
         Args:
             raw_message: Message object from Telethon
             chat_id: Chat ID
+            unique_senders: Set collecting user sender IDs for batch resolution
 
         Returns:
-            DeletedMessage object with extracted data
+            Message record dict matching DeletedMessage's JSON serialization
         """
         # Extract sender information
         sender_id = None
         sender_name = None
         sender_username = None
 
-        if raw_message.from_id:
+        from_id = raw_message.from_id
+        if from_id:
             # from_id is a Peer object (PeerUser, PeerChannel, or PeerChat)
-            if isinstance(raw_message.from_id, PeerUser):
-                sender_id = raw_message.from_id.user_id
-                try:
-                    # Use cached entity lookup to avoid redundant API calls
-                    user = await self.telegram_service.get_entity_cached(sender_id)
-                    if isinstance(user, User):
-                        sender_name = " ".join(
-                            filter(None, [user.first_name, user.last_name])
-                        )
-                        sender_username = user.username
-                except Exception as e:
-                    logger.debug(f"Could not fetch user info for {sender_id}: {e}")
-            elif isinstance(raw_message.from_id, PeerChannel):
-                sender_id = raw_message.from_id.channel_id
-            elif isinstance(raw_message.from_id, PeerChat):
-                sender_id = raw_message.from_id.chat_id
+            handler = _PEER_HANDLERS.get(type(from_id))
+            if handler:
+                get_peer_id, is_user = handler
+                sender_id = get_peer_id(from_id)
+                if is_user:
+                    unique_senders.add(sender_id)
 
         # Extract reply information
         reply_to_msg_id = None
@@ -528,17 +779,18 @@ class ExportService:
         # Determine media type
         media_type = type(raw_message.media).__name__ if raw_message.media else None
 
-        return DeletedMessage(
-            message_id=raw_message.id,
-            chat_id=chat_id,
-            sender_id=sender_id,
-            sender_name=sender_name,
-            sender_username=sender_username,
-            text=raw_message.message,
-            date=raw_message.date,
-            has_media=raw_message.media is not None,
-            media_type=media_type,
-            reply_to_msg_id=reply_to_msg_id,
-            reply_to_top_id=reply_to_top_id,
-            quote_text=quote_text,
-        )
+        return {
+            "message_id": raw_message.id,
+            "chat_id": chat_id,
+            "sender_id": sender_id,
+            "sender_name": sender_name,
+            "sender_username": sender_username,
+            "text": raw_message.message,
+            "date": raw_message.date.isoformat() if raw_message.date else None,
+            "has_media": raw_message.media is not None,
+            "media_type": media_type,
+            "media_file_path": None,
+            "reply_to_msg_id": reply_to_msg_id,
+            "reply_to_top_id": reply_to_top_id,
+            "quote_text": quote_text,
+        }
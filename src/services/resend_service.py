@@ -3,12 +3,16 @@ Service for re-sending exported messages to Telegram.
 """
 
 import asyncio
-import html
-import json
+import io
+import os
+import random
+import time
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Awaitable, Callable, List, Optional
+from typing import Awaitable, Callable, Iterator, List, Optional
 
+from pydantic import TypeAdapter
 from telethon.errors import FloodWaitError, RPCError
 
 from ..models.config import ResendConfig
@@ -23,14 +27,224 @@ ProgressCallback = Callable[[ExportProgress], Awaitable[None]]
 # Constants
 TELEGRAM_FILE_SIZE_LIMIT = 2_000_000_000  # 2GB
 TELEGRAM_CAPTION_LIMIT = 1024
+TELEGRAM_ALBUM_LIMIT = 10  # max grouped media per sendMultiMedia RPC
 MESSAGE_SEND_DELAY = 2  # seconds between messages
 MAX_SEND_RETRIES = 3  # Maximum retries for sending messages/media
+FLOOD_WAIT_AUTO_THRESHOLD = 60  # seconds; longer flood waits abort instead of blocking
+RETRY_BACKOFF_BASE = 1.0  # seconds
+RETRY_BACKOFF_CAP = 30.0  # seconds
+RETRY_BACKOFF_JITTER = 0.5  # up to +50% random spread to avoid retry stampedes
+PROGRESS_EMIT_INTERVAL = 0.1  # seconds; per-message updates are coalesced to this rate
+
+# Prebuilt adapter: decodes the whole metadata file into models in a single
+# pydantic-core pass, instead of json.loads + per-message DeletedMessage(**d)
+_MESSAGE_LIST_ADAPTER = TypeAdapter(List[DeletedMessage])
+
+
+def _is_date_ordered(messages: List[DeletedMessage]) -> bool:
+    """
+    Check whether messages are already in ascending date order.
+
+    The export side writes metadata chronologically, so this single O(n)
+    pass normally saves the O(n log n) re-sort; only hand-edited or
+    legacy files fail the check. Undated messages are ignored here (the
+    sort would float them to the front, which callers tolerate).
+    """
+    previous = None
+    for message in messages:
+        current = message.date
+        if current is None:
+            continue
+        if previous is not None and current < previous:
+            return False
+        previous = current
+    return True
+
+
+def _load_and_prepare(
+    metadata_file: Path,
+) -> tuple[List[DeletedMessage], dict[int, tuple[str, int]]]:
+    """
+    Read, validate and order the metadata file, and stat its media files.
+
+    Runs as one unit on a worker thread: the read is blocking I/O and
+    the pydantic-core decode of a multi-MB file is CPU-bound (the GIL is
+    released inside the Rust parser), so neither should sit on the event
+    loop. The exporter writes the file chronologically; sorting only
+    happens for out-of-order (hand-edited or legacy) files.
+
+    Media sizes are resolved here too: one upfront stat pass replaces a
+    per-message exists+stat round-trip at send time. Missing files are
+    simply absent from the table.
+
+    Args:
+        metadata_file: Path to messages_metadata.json
+
+    Returns:
+        Tuple of (messages in ascending date order,
+        {message_id: (media path, file size)} for media that exists)
+    """
+    messages = _MESSAGE_LIST_ADAPTER.validate_json(metadata_file.read_bytes())
+    if not _is_date_ordered(messages):
+        # Partition out the (rare) undated messages so the sort key is a
+        # plain C-level attrgetter, not a fallback lambda evaluated
+        # O(n log n) times
+        dated = [m for m in messages if m.date is not None]
+        dated.sort(key=attrgetter("date"))
+        undated = [m for m in messages if m.date is None]
+        messages = undated + dated
+
+    # Group media paths by parent directory and resolve sizes with one
+    # scandir listing per directory: DirEntry.stat reuses data the kernel
+    # already returned, instead of a cold stat syscall per file
+    groups: dict[str, list[tuple[str, int, str]]] = {}
+    for message in messages:
+        path = message.media_file_path
+        if path:
+            directory, name = os.path.split(path)
+            groups.setdefault(directory or ".", []).append(
+                (name, message.message_id, path)
+            )
+
+    media_info: dict[int, tuple[str, int]] = {}
+    for directory, entries in groups.items():
+        wanted = {name for name, _, _ in entries}
+        sizes: dict[str, int] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name in wanted:
+                        sizes[entry.name] = entry.stat().st_size
+        except OSError:
+            continue  # missing directory: reported per message at send time
+        for name, message_id, path in entries:
+            size = sizes.get(name)
+            if size is not None:
+                media_info[message_id] = (path, size)
+    return messages, media_info
+
+
+# One-pass HTML escaping: html.escape chains four str.replace passes,
+# each allocating an intermediate string; str.translate does it in one
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+# Reply-link templates, selected once instead of rebuilding f-strings
+_REPLY_LINK_THREAD_FMT = "https://t.me/c/{}/{}/{}"
+_REPLY_LINK_FMT = "https://t.me/c/{}/{}"
+
+
+def _make_sender_fn(config: ResendConfig) -> Callable[[DeletedMessage], Optional[str]]:
+    """Build the sender header section for the given config."""
+    show_name = config.show_sender_name
+    show_username = config.show_sender_username
+
+    def sender_fn(msg: DeletedMessage) -> Optional[str]:
+        name = msg.sender_name if show_name else None
+        username = msg.sender_username if show_username else None
+        if name and username:
+            return f"{name} (@{username})"
+        if name:
+            return name
+        if username:
+            return f"@{username}"
+        return None
+
+    return sender_fn
+
+
+def _make_reply_fn(config: ResendConfig) -> Callable[[DeletedMessage], Optional[str]]:
+    """Build the reply-link header section for the given config."""
+    hidden = config.use_hidden_reply_links
+
+    def reply_fn(msg: DeletedMessage) -> Optional[str]:
+        if not (msg.reply_to_msg_id and msg.chat_id):
+            return None
+        if msg.reply_to_top_id:
+            link = _REPLY_LINK_THREAD_FMT.format(
+                msg.chat_id, msg.reply_to_top_id, msg.reply_to_msg_id
+            )
+        else:
+            link = _REPLY_LINK_FMT.format(msg.chat_id, msg.reply_to_msg_id)
+        return f'<a href="{link}">↩️ Reply</a>' if hidden else link
+
+    return reply_fn
+
+
+def _make_date_fn(config: ResendConfig) -> Callable[[DeletedMessage], Optional[str]]:
+    """Build the date header section for the given config."""
+    tz_offset = config.timezone_offset_hours
+
+    def date_fn(msg: DeletedMessage) -> Optional[str]:
+        return msg.get_formatted_date(tz_offset) if msg.date else None
+
+    return date_fn
+
+
+# Header section bits; the sender section answers to either sender flag
+_HDR_SENDER_NAME = 1 << 0
+_HDR_SENDER_USERNAME = 1 << 1
+_HDR_REPLY_LINK = 1 << 2
+_HDR_DATE = 1 << 3
+
+# (mask, factory) per section, in display order. Compilation is a masked
+# table walk instead of a chain of config-flag branches.
+_HEADER_SECTION_TABLE: tuple = (
+    (_HDR_SENDER_NAME | _HDR_SENDER_USERNAME, _make_sender_fn),
+    (_HDR_REPLY_LINK, _make_reply_fn),
+    (_HDR_DATE, _make_date_fn),
+)
+
+
+def _compile_header_formatter(
+    config: ResendConfig,
+) -> Callable[[DeletedMessage], str]:
+    """
+    Build a header formatter specialized for the given config.
+
+    The config flags are constant for a whole resend run, so they are
+    folded into a bitmask once; the returned closure carries only the
+    section formatters whose bits are set, so the per-message loop is
+    straight-line over a short tuple with no flag branches left.
+
+    Args:
+        config: Resend configuration
+
+    Returns:
+        Function mapping a message to its header string ("" when empty)
+    """
+    mask = (
+        (config.show_sender_name and _HDR_SENDER_NAME)
+        | (config.show_sender_username and _HDR_SENDER_USERNAME)
+        | (config.show_reply_link and _HDR_REPLY_LINK)
+        | (config.show_date and _HDR_DATE)
+    )
+    part_fns = tuple(
+        factory(config) for bits, factory in _HEADER_SECTION_TABLE if mask & bits
+    )
+
+    def format_header(msg: DeletedMessage) -> str:
+        return " - ".join(part for fn in part_fns if (part := fn(msg)))
+
+    return format_header
+
+
+async def _sleep_backoff(attempt: int) -> None:
+    """Sleep with exponential backoff and jitter for the given attempt."""
+    delay = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt)
+    await asyncio.sleep(delay * (1 + random.random() * RETRY_BACKOFF_JITTER))
 
 
 def safe_truncate_utf8(text: str, max_length: int) -> str:
     """
     Safely truncate text without breaking UTF-8 multibyte characters.
 
+    Python strings are code-point indexed, so slicing can never split a
+    multibyte sequence; the only hazard is cutting between a surrogate
+    pair member left by broken input, which the single backward step
+    handles. No encode pass is needed.
+
     Args:
         text: Text to truncate
         max_length: Maximum length in characters
@@ -43,15 +257,10 @@ def safe_truncate_utf8(text: str, max_length: int) -> str:
 
     # Reserve 3 characters for "..."
     truncate_at = max_length - 3
-    truncated = text[:truncate_at]
-
-    # Verify UTF-8 encoding is valid at this boundary
-    try:
-        truncated.encode("utf-8")
-        return truncated + "..."
-    except UnicodeEncodeError:
-        # If broken, try one character less recursively
-        return safe_truncate_utf8(text, max_length - 1)
+    if truncate_at > 0 and "\ud800" <= text[truncate_at - 1] <= "\udbff":
+        # Don't end on a lone high surrogate
+        truncate_at -= 1
+    return text[:truncate_at] + "..."
 
 
 class ResendService:
@@ -67,6 +276,20 @@ class ResendService:
         self.telegram_service = telegram_service
         self._current_progress: Optional[ExportProgress] = None
         self._should_cancel = False
+        # Header formatter compiled once per run in resend_messages
+        self._header_fmt: Optional[Callable[[DeletedMessage], str]] = None
+        # Monotonic timestamp of the last progress emission (see
+        # _maybe_emit_progress)
+        self._last_progress_emit = 0.0
+        # Whether the callback is a coroutine function, resolved once per
+        # run instead of inspecting its return value per call
+        self._progress_cb_is_async = False
+        # Live pipeline handles so cancel() can abort in-flight sends
+        self._send_workers: List[asyncio.Task] = []
+        self._send_queue: Optional[asyncio.Queue] = None
+        # {message_id: (media path, file size)}, built during load so the
+        # send path never stats the filesystem
+        self._media_info: dict[int, tuple[str, int]] = {}
 
     @property
     def current_progress(self) -> Optional[ExportProgress]:
@@ -74,9 +297,23 @@ class ResendService:
         return self._current_progress
 
     def cancel(self):
-        """Cancel the current resend operation."""
+        """Cancel the current resend operation.
+
+        Besides setting the flag checked at batch boundaries, the worker
+        tasks are cancelled outright: Telethon send coroutines are
+        cancellable, so a stuck multi-GB upload aborts immediately
+        instead of running to completion. Draining the queue wakes a
+        producer blocked on a full queue so it can see the flag.
+        """
         logger.info("Resend cancellation requested")
         self._should_cancel = True
+        for task in self._send_workers:
+            if not task.done():
+                task.cancel()
+        queue = self._send_queue
+        if queue is not None:
+            while not queue.empty():
+                queue.get_nowait()
 
     async def _call_progress_callback(
         self, callback: Optional[ProgressCallback], progress: ExportProgress
@@ -84,14 +321,40 @@ class ResendService:
         """
         Safely call progress callback.
 
+        Sync callbacks (the UI passes plain lambdas) are invoked
+        directly; the async/sync decision was made once in
+        resend_messages, so there is no per-call introspection here.
+
         Args:
             callback: Progress callback function
             progress: Progress object to pass to callback
         """
         if callback:
-            result = callback(progress)
-            if asyncio.iscoroutine(result):
-                await result
+            if self._progress_cb_is_async:
+                await callback(progress)
+            else:
+                callback(progress)
+
+    async def _maybe_emit_progress(
+        self, callback: Optional[ProgressCallback], force: bool = False
+    ) -> None:
+        """
+        Emit progress, coalescing per-message updates.
+
+        Awaiting the callback after every message suspends the event loop
+        once per message; throttling to PROGRESS_EMIT_INTERVAL keeps the
+        UI fresh while cutting the scheduler round-trips. Terminal and
+        batch-boundary updates pass force=True so the final counters are
+        never dropped.
+
+        Args:
+            callback: Progress callback function
+            force: Bypass the rate limit for must-deliver updates
+        """
+        now = time.monotonic()
+        if force or now - self._last_progress_emit >= PROGRESS_EMIT_INTERVAL:
+            self._last_progress_emit = now
+            await self._call_progress_callback(callback, self._current_progress)
 
     async def resend_messages(
         self,
@@ -120,81 +383,194 @@ class ResendService:
         # Initialize progress tracking with start time
         self._current_progress = ExportProgress(start_time=datetime.now(timezone.utc))
 
+        # Resolve the header layout once for the whole run
+        self._header_fmt = _compile_header_formatter(config)
+        self._last_progress_emit = 0.0
+        self._progress_cb_is_async = asyncio.iscoroutinefunction(progress_callback)
+
         # Load messages from metadata file
         source_dir = Path(config.source_directory)
         metadata_file = source_dir / "messages_metadata.json"
 
-        if not metadata_file.exists():
+        # Existence check and read are blocking syscalls; keep them off
+        # the event loop so progress updates and Telethon keepalives run
+        if not await asyncio.to_thread(metadata_file.exists):
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
         try:
-            # Load and parse messages
-            messages_data = json.loads(metadata_file.read_text(encoding="utf-8"))
-
-            # Convert to DeletedMessage objects and sort by date
-            messages = [DeletedMessage(**msg_data) for msg_data in messages_data]
-            messages = sorted(messages, key=lambda m: m.date or datetime.min)
+            # Read, validate, order and stat media on a worker thread so
+            # the event loop stays responsive during the load phase
+            messages, self._media_info = await asyncio.to_thread(
+                _load_and_prepare, metadata_file
+            )
 
             self._current_progress.total_messages = len(messages)
 
-            # Create batches (groups consecutive short messages if batching enabled)
+            # Batches are generated lazily (groups consecutive short
+            # messages if batching enabled), so sending starts before the
+            # whole list has been scanned
             message_batches = self._create_message_batches(messages, config)
-            logger.info(
-                f"Created {len(message_batches)} batches from {len(messages)} messages"
-            )
+            logger.info(f"Resending {len(messages)} messages")
 
             # Get target chat entity
             target_entity = await self.telegram_service.client.get_entity(
                 config.target_chat_id
             )
 
-            # Process each batch
-            for batch in message_batches:
-                # Check for cancellation
-                if self._should_cancel:
-                    logger.info("Resend cancelled by user")
-                    self._current_progress.error_message = "Cancelled by user"
-                    self._current_progress.is_cancelled = True
-                    self._current_progress.is_complete = True
-                    await self._call_progress_callback(
-                        progress_callback, self._current_progress
+            # Bounded pipeline: batches flow through a small queue into
+            # worker tasks. With the default of one worker sends stay
+            # strictly in chronological order; more workers overlap
+            # uploads at the cost of that ordering (and of Telegram rate
+            # limits), so raising the setting is an explicit opt-in.
+            send_queue: asyncio.Queue = asyncio.Queue(
+                maxsize=config.max_concurrent_uploads * 2
+            )
+            send_workers = [
+                asyncio.create_task(
+                    self._send_worker(
+                        send_queue, target_entity, config, progress_callback
                     )
-                    break
-
-                # Process this batch (may be 1 message or multiple combined)
-                await self._resend_message_batch(
-                    batch, target_entity, config, progress_callback
                 )
+                for _ in range(config.max_concurrent_uploads)
+            ]
+            # Expose the pipeline to cancel()
+            self._send_workers = send_workers
+            self._send_queue = send_queue
+
+            try:
+                for batch in message_batches:
+                    # Check for cancellation
+                    if self._should_cancel:
+                        logger.info("Resend cancelled by user")
+                        self._current_progress.error_message = "Cancelled by user"
+                        self._current_progress.is_cancelled = True
+                        self._current_progress.is_complete = True
+                        await self._maybe_emit_progress(progress_callback, force=True)
+                        break
+                    await send_queue.put(batch)
+            finally:
+                if self._should_cancel:
+                    # Workers may be cancelled and no longer consuming:
+                    # drop queued batches so the sentinels below fit in
+                    # the queue without blocking
+                    while not send_queue.empty():
+                        send_queue.get_nowait()
+                # Drain the worker pool: one sentinel per worker, then
+                # wait for in-flight sends to finish (cancelled workers
+                # surface as CancelledError, absorbed by the gather)
+                for _ in send_workers:
+                    await send_queue.put(None)
+                await asyncio.gather(*send_workers, return_exceptions=True)
+                self._send_workers = []
+                self._send_queue = None
 
             # Mark as complete (if not cancelled)
             if not self._should_cancel:
                 self._current_progress.is_complete = True
 
-                await self._call_progress_callback(
-                    progress_callback, self._current_progress
-                )
+                await self._maybe_emit_progress(progress_callback, force=True)
 
         except RPCError as e:
             error_msg = f"Telegram API error: {e}"
             logger.error(error_msg)
             self._current_progress.error_message = error_msg
             self._current_progress.is_complete = True
-            await self._call_progress_callback(
-                progress_callback, self._current_progress
-            )
+            await self._maybe_emit_progress(progress_callback, force=True)
             raise RuntimeError(self._current_progress.error_message) from e
         except Exception as e:
             error_msg = f"Unexpected error: {e}"
             logger.exception(error_msg)
             self._current_progress.error_message = error_msg
             self._current_progress.is_complete = True
-            await self._call_progress_callback(
-                progress_callback, self._current_progress
-            )
+            await self._maybe_emit_progress(progress_callback, force=True)
             raise
 
         return self._current_progress
 
+    async def _send_worker(
+        self,
+        queue: asyncio.Queue,
+        target_entity,
+        config: ResendConfig,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        """
+        Consume message batches from the queue until a None sentinel.
+
+        Args:
+            queue: Queue of message batches
+            target_entity: Target Telegram entity
+            config: Resend configuration
+            progress_callback: Optional progress callback
+        """
+        try:
+            while (batch := await queue.get()) is not None:
+                try:
+                    await self._resend_message_batch(
+                        batch, target_entity, config, progress_callback
+                    )
+                except Exception as e:
+                    # Per-batch failures are handled inside; anything
+                    # escaping here is logged so the worker keeps going
+                    logger.error(f"Error sending batch: {e}", exc_info=e)
+        except asyncio.CancelledError:
+            # cancel() aborted this worker mid-send
+            self._current_progress.is_cancelled = True
+            raise
+
+    async def _send_with_retry(
+        self,
+        send: Callable[[], Awaitable],
+        message_id: Optional[int],
+        batch_size: int = 1,
+    ) -> bool:
+        """
+        Run a send call with flood-wait-aware retries.
+
+        Short flood waits are retried with exponential backoff plus
+        jitter; waits above FLOOD_WAIT_AUTO_THRESHOLD give up right away
+        instead of stalling the whole run for Telegram-imposed minutes.
+        Failures are counted against the progress stats.
+
+        Args:
+            send: Zero-argument factory producing the send coroutine
+            message_id: Message ID (first of the batch) for logging
+            batch_size: Number of messages covered by this send
+
+        Returns:
+            True if the send succeeded, False otherwise
+        """
+        for attempt in range(MAX_SEND_RETRIES):
+            try:
+                await send()
+                return True
+
+            except FloodWaitError as e:
+                if e.seconds > FLOOD_WAIT_AUTO_THRESHOLD:
+                    logger.error(
+                        f"Flood wait of {e.seconds}s for message {message_id} "
+                        f"exceeds auto-retry threshold ({FLOOD_WAIT_AUTO_THRESHOLD}s); giving up"
+                    )
+                    break
+                logger.warning(
+                    f"Rate limit hit while sending message {message_id}. "
+                    f"Telegram requires waiting {e.seconds} seconds. "
+                    f"(Retry {attempt + 1}/{MAX_SEND_RETRIES})"
+                )
+                if attempt == MAX_SEND_RETRIES - 1:
+                    logger.error(
+                        f"Max retries reached for message {message_id} after rate limiting"
+                    )
+                    break
+                await _sleep_backoff(attempt)
+
+            except Exception as e:
+                logger.error(f"Failed to send message {message_id}: {e}")
+                break
+
+        self._current_progress.failed_messages += batch_size
+        return False
+
     async def _resend_single_message(
         self,
         message: DeletedMessage,
@@ -215,135 +591,95 @@ class ResendService:
         self._current_progress.current_message_id = message.message_id
 
         try:
-            # Build message content
-            message_text = await self._build_message_text(message, config)
-
-            # Check if we should send this message
+            # Check if we should send this message before doing any work
             if not config.include_text and not message.has_media:
                 return
             if not config.include_media and message.has_media and not message.has_text:
                 return
 
+            # Text is built on first use: media-only sends with
+            # include_text off never pay for escaping and formatting
+            message_text: Optional[str] = None
+
+            def get_text() -> str:
+                nonlocal message_text
+                if message_text is None:
+                    message_text = self._build_message_text(message, config)
+                return message_text
+
             sent_media = False
 
             # Send media if present and configured
             if message.has_media and config.include_media and message.media_file_path:
-                # Use the media_file_path from metadata directly
-                # The path is relative to the current working directory
-                media_file = Path(message.media_file_path)
-
-                # Validate file exists and is readable
-                if not media_file.exists():
+                # Path and size were resolved during load; a miss means
+                # the file did not exist then
+                media_info = self._media_info.get(message.message_id)
+                if media_info is None:
+                    media_file = file_size = None
                     logger.warning(
-                        f"Media file not found for message {message.message_id}: {media_file}"
+                        f"Media file not found for message {message.message_id}: "
+                        f"{message.media_file_path}"
                     )
                 else:
-                    # Check file size (Telegram limits: 2GB for most files)
-                    file_size = media_file.stat().st_size
+                    media_file, file_size = media_info
 
+                if file_size is not None:
+                    # Check file size (Telegram limits: 2GB for most files)
                     if file_size > TELEGRAM_FILE_SIZE_LIMIT:
                         logger.warning(
                             f"File too large ({file_size / 1_000_000:.1f}MB) for message {message.message_id}: {media_file}"
                         )
                     else:
-                        # Retry logic for sending media
-                        retry_count = 0
-                        while retry_count < MAX_SEND_RETRIES:
-                            try:
-                                # Prepare caption with length validation
-                                caption = None
-                                if config.include_text and message_text:
-                                    # Telegram caption limit
-                                    caption = safe_truncate_utf8(
-                                        message_text, TELEGRAM_CAPTION_LIMIT
-                                    )
-
-                                # Send file (Telethon automatically detects media type from file extension)
-                                logger.debug(
-                                    f"Sending media file ({file_size / 1_000:.1f}KB): {media_file.name}"
-                                )
-                                await self.telegram_service.client.send_file(
-                                    entity=target_entity,
-                                    file=str(media_file),
-                                    caption=caption,
-                                    silent=True,
-                                    force_document=False,  # Let Telegram detect type automatically
-                                )
-                                sent_media = True
-                                self._current_progress.exported_media_messages += 1
-                                logger.debug(
-                                    f"Successfully sent media: {media_file.name}"
-                                )
-                                break  # Success, exit retry loop
-
-                            except FloodWaitError as e:
-                                retry_count += 1
-                                logger.warning(
-                                    f"Rate limit hit while sending media for message {message.message_id}. "
-                                    f"Telegram requires waiting {e.seconds} seconds. "
-                                    f"(Retry {retry_count}/{MAX_SEND_RETRIES})"
-                                )
-                                if retry_count < MAX_SEND_RETRIES:
-                                    await asyncio.sleep(e.seconds)
-                                else:
-                                    logger.error(
-                                        f"Max retries reached for message {message.message_id} after rate limiting"
-                                    )
-                                    self._current_progress.failed_messages += 1
-                                    break
-
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to send media {media_file.name} for message {message.message_id}: {e}"
-                                )
-                                self._current_progress.failed_messages += 1
-                                break
-
-            # Send text message if media wasn't sent and we have text
-            if not sent_media and config.include_text and message_text:
-                retry_count = 0
-                while retry_count < MAX_SEND_RETRIES:
-                    try:
-                        await self.telegram_service.client.send_message(
-                            entity=target_entity,
-                            message=message_text,
-                            silent=True,
-                            parse_mode="html",
-                        )
-                        self._current_progress.exported_text_messages += 1
-                        break  # Success, exit retry loop
+                        # Prepare caption with length validation (Telegram
+                        # caption limit)
+                        caption = None
+                        if config.include_text and get_text():
+                            caption = safe_truncate_utf8(
+                                message_text, TELEGRAM_CAPTION_LIMIT
+                            )
 
-                    except FloodWaitError as e:
-                        retry_count += 1
-                        logger.warning(
-                            f"Rate limit hit while sending text message for message {message.message_id}. "
-                            f"Telegram requires waiting {e.seconds} seconds. "
-                            f"(Retry {retry_count}/{MAX_SEND_RETRIES})"
+                        # Send file (Telethon automatically detects media type from file extension)
+                        logger.debug(
+                            f"Sending media file ({file_size / 1_000:.1f}KB): "
+                            f"{os.path.basename(media_file)}"
                         )
-                        if retry_count < MAX_SEND_RETRIES:
-                            await asyncio.sleep(e.seconds)
-                        else:
-                            logger.error(
-                                f"Max retries reached for message {message.message_id} after rate limiting"
+                        if await self._send_with_retry(
+                            lambda: self.telegram_service.client.send_file(
+                                entity=target_entity,
+                                file=media_file,
+                                caption=caption,
+                                silent=True,
+                                force_document=False,  # Let Telegram detect type automatically
+                            ),
+                            message.message_id,
+                        ):
+                            sent_media = True
+                            self._current_progress.exported_media_messages += 1
+                            logger.debug(
+                                f"Successfully sent media: {os.path.basename(media_file)}"
                             )
-                            self._current_progress.failed_messages += 1
-                            break
 
-                    except Exception as e:
-                        logger.error(f"Failed to send text message: {e}")
-                        self._current_progress.failed_messages += 1
-                        break
+            # Send text message if media wasn't sent and we have text
+            if not sent_media and config.include_text and get_text():
+                if await self._send_with_retry(
+                    lambda: self.telegram_service.client.send_message(
+                        entity=target_entity,
+                        message=message_text,
+                        silent=True,
+                        parse_mode="html",
+                    ),
+                    message.message_id,
+                ):
+                    self._current_progress.exported_text_messages += 1
 
-            # Call progress callback
-            await self._call_progress_callback(
-                progress_callback, self._current_progress
-            )
+            # Throttled: per-message emissions are coalesced
+            await self._maybe_emit_progress(progress_callback)
 
         except Exception as e:
             logger.error(f"Error resending message {message.message_id}: {e}")
             self._current_progress.failed_messages += 1
 
-    async def _build_message_text(
+    def _build_message_text(
         self, message: DeletedMessage, config: ResendConfig
     ) -> str:
         """
@@ -356,151 +692,169 @@ class ResendService:
         Returns:
             Formatted message text
         """
-        text_parts = []
-
-        # Build header with granular controls
-        header_parts = []
-
-        # Sender info (name and/or username)
-        if config.show_sender_name or config.show_sender_username:
-            sender_parts = []
-
-            if config.show_sender_name and message.sender_name:
-                sender_parts.append(message.sender_name)
-
-            if config.show_sender_username and message.sender_username:
-                username_part = f"@{message.sender_username}"
-                if sender_parts:  # Already have name
-                    sender_parts[0] = f"{sender_parts[0]} ({username_part})"
-                else:  # Only username
-                    sender_parts.append(username_part)
-
-            if sender_parts:
-                header_parts.append(sender_parts[0])
-
-        # Reply link (hidden or visible)
-        if config.show_reply_link and message.reply_to_msg_id and message.chat_id:
-            if message.reply_to_top_id:
-                reply_link = f"https://t.me/c/{message.chat_id}/{message.reply_to_top_id}/{message.reply_to_msg_id}"
-            else:
-                reply_link = (
-                    f"https://t.me/c/{message.chat_id}/{message.reply_to_msg_id}"
-                )
-
-            if config.use_hidden_reply_links:
-                # HTML hidden link
-                header_parts.append(f'<a href="{reply_link}">↩️ Reply</a>')
-            else:
-                header_parts.append(reply_link)
-
-        # Date with timezone adjustment
-        if config.show_date and message.date:
-            formatted_date = message.get_formatted_date(config.timezone_offset_hours)
-            header_parts.append(formatted_date)
-
-        if header_parts:
-            text_parts.append(" - ".join(header_parts))
+        # Sections are written straight into one growable buffer instead
+        # of collecting a list of parts and joining
+        buf = io.StringIO()
+        empty = True
+
+        def emit(part: str) -> None:
+            nonlocal empty
+            if not empty:
+                buf.write("\n\n")
+            buf.write(part)
+            empty = False
+
+        # Header layout was compiled once per run from the config flags
+        header_fmt = self._header_fmt or _compile_header_formatter(config)
+        header = header_fmt(message)
+        if header:
+            emit(header)
 
         # Quote text
         if message.quote_text:
-            escaped_quote = html.escape(message.quote_text)
-            text_parts.append(f"<pre>❝ {escaped_quote} ❞</pre>")
+            escaped_quote = message.quote_text.translate(_HTML_ESCAPE_TABLE)
+            emit(f"<pre>❝ {escaped_quote} ❞</pre>")
 
         # Message text
         if message.text:
-            text_parts.append(message.text)
+            emit(message.text)
 
         # Fallback
-        if not text_parts and message.date:
-            text_parts.append(message.get_formatted_date(config.timezone_offset_hours))
+        if empty and message.date:
+            return message.get_formatted_date(config.timezone_offset_hours)
 
-        return "\n\n".join(text_parts)
+        return buf.getvalue()
 
     def _create_message_batches(
         self, messages: List[DeletedMessage], config: ResendConfig
-    ) -> List[List[DeletedMessage]]:
+    ) -> Iterator[List[DeletedMessage]]:
         """
-        Group consecutive short text messages into batches.
+        Group consecutive messages into batches.
 
-        Strategy:
-        - Only batch text-only messages (no media)
-        - Same sender only
-        - Within time window
-        - Short messages only
-        - Don't batch replies (preserve context)
-        - Keep total under 4000 chars (safe margin)
+        Two batch kinds are built, never mixed:
+        - Text batches: short text-only messages from the same sender
+          within the time window, no replies, total under 4000 chars.
+          Sent as one combined text message.
+        - Album batches: media messages from the same sender and of the
+          same media type within the time window, up to the Telegram
+          album cap of 10. Sent as one grouped sendMultiMedia RPC.
+
+        Batches are yielded as they complete, so sending can start before
+        the whole list has been scanned and no O(n) batch list is held.
 
         Returns:
-            List of message batches (each batch is a list of messages)
+            Iterator of message batches (each batch is a list of messages)
         """
         if not config.enable_batching:
-            # Return each message as its own batch
-            return [[msg] for msg in messages]
+            # Yield each message as its own batch
+            for msg in messages:
+                yield [msg]
+            return
 
-        batches = []
+        media_info = self._media_info
         current_batch = []
+        # Running state for the open batch: kind, char total, first sender
+        # and last date are maintained incrementally so each message is
+        # O(1) instead of re-scanning the batch
+        current_kind = None
+        current_chars = 0
+        current_sender_id = None
+        current_media_type = None
+        current_last_date = None
 
         for message in messages:
-            # Check if message is batchable
-            can_batch = (
+            # Classify the message: combined-text candidate, album
+            # candidate, or neither (replies never batch, to preserve
+            # context; media without a file on disk falls back to the
+            # single-message path and its warning)
+            if message.reply_to_msg_id:
+                kind = None
+            elif (
                 not message.has_media
                 and message.has_text
-                and not message.reply_to_msg_id  # Don't batch replies
                 and message.text
                 and len(message.text) <= config.batch_max_message_length
-            )
+            ):
+                kind = "text"
+            elif (
+                message.has_media
+                and config.include_media
+                and (info := media_info.get(message.message_id)) is not None
+                and info[1] <= TELEGRAM_FILE_SIZE_LIMIT
+            ):
+                kind = "album"
+            else:
+                kind = None
 
-            if not can_batch:
-                # Flush current batch and add this message separately
+            if kind is None:
+                # Flush current batch and yield this message separately
                 if current_batch:
-                    batches.append(current_batch)
+                    yield current_batch
                     current_batch = []
-                batches.append([message])
+                    current_chars = 0
+                yield [message]
                 continue
 
             # Check if we can add to current batch
             can_add_to_batch = False
+            text_len = len(message.text or "")
 
-            if current_batch:
-                first_msg = current_batch[0]
-                last_msg = current_batch[-1]
-
-                # Check constraints
-                same_sender = message.sender_id == first_msg.sender_id
+            if current_batch and current_kind == kind:
+                # Check shared constraints
+                same_sender = message.sender_id == current_sender_id
                 within_time = (
                     message.date
-                    and last_msg.date
-                    and (message.date - last_msg.date)
+                    and current_last_date
+                    and (message.date - current_last_date)
                     <= timedelta(minutes=config.batch_time_window_minutes)
                 )
-                not_full = len(current_batch) < config.batch_max_messages
 
-                # Estimate total length if we add this message
-                total_length = sum(len(msg.text or "") for msg in current_batch) + len(
-                    message.text or ""
-                )
-                # Account for separators and header (rough estimate: 200 chars)
-                estimated_total = total_length + (len(current_batch) * 2) + 200
-                under_limit = estimated_total < 4000
+                if kind == "text":
+                    not_full = len(current_batch) < config.batch_max_messages
 
-                can_add_to_batch = (
-                    same_sender and within_time and not_full and under_limit
-                )
+                    # Estimate total length if we add this message
+                    # (account for separators and header; rough estimate: 200 chars)
+                    estimated_total = (
+                        current_chars + text_len + (len(current_batch) * 2) + 200
+                    )
+                    under_limit = estimated_total < 4000
+
+                    can_add_to_batch = (
+                        same_sender and within_time and not_full and under_limit
+                    )
+                else:
+                    # Albums group only like media types, and cap at the
+                    # Telegram grouped-media limit
+                    can_add_to_batch = (
+                        same_sender
+                        and within_time
+                        and message.media_type == current_media_type
+                        and len(current_batch) < TELEGRAM_ALBUM_LIMIT
+                    )
 
             if can_add_to_batch or not current_batch:
+                if not current_batch:
+                    current_kind = kind
+                    current_sender_id = message.sender_id
+                    current_media_type = message.media_type
                 current_batch.append(message)
+                current_chars += text_len
+                current_last_date = message.date
             else:
                 # Start new batch
-                batches.append(current_batch)
+                yield current_batch
                 current_batch = [message]
+                current_kind = kind
+                current_chars = text_len
+                current_sender_id = message.sender_id
+                current_media_type = message.media_type
+                current_last_date = message.date
 
         # Don't forget last batch
         if current_batch:
-            batches.append(current_batch)
-
-        return batches
+            yield current_batch
 
-    async def _build_batched_message_text(
+    def _build_batched_message_text(
         self, batch: List[DeletedMessage], config: ResendConfig
     ) -> str:
         """
@@ -515,62 +869,34 @@ class ResendService:
             Formatted batched message text
         """
         if len(batch) == 1:
-            return await self._build_message_text(batch[0], config)
+            return self._build_message_text(batch[0], config)
 
         first_message = batch[0]
-        text_parts = []
-
-        # Build header from first message only
-        header_parts = []
-
-        # Sender info
-        if config.show_sender_name or config.show_sender_username:
-            sender_parts = []
-            if config.show_sender_name and first_message.sender_name:
-                sender_parts.append(first_message.sender_name)
-            if config.show_sender_username and first_message.sender_username:
-                username_part = f"@{first_message.sender_username}"
-                if sender_parts:
-                    sender_parts[0] = f"{sender_parts[0]} ({username_part})"
-                else:
-                    sender_parts.append(username_part)
-            if sender_parts:
-                header_parts.append(sender_parts[0])
-
-        # Reply link from first message (shouldn't happen in batches, but handle it)
-        if (
-            config.show_reply_link
-            and first_message.reply_to_msg_id
-            and first_message.chat_id
-        ):
-            if first_message.reply_to_top_id:
-                reply_link = f"https://t.me/c/{first_message.chat_id}/{first_message.reply_to_top_id}/{first_message.reply_to_msg_id}"
-            else:
-                reply_link = f"https://t.me/c/{first_message.chat_id}/{first_message.reply_to_msg_id}"
-
-            if config.use_hidden_reply_links:
-                header_parts.append(f'<a href="{reply_link}">↩️ Reply</a>')
-            else:
-                header_parts.append(reply_link)
 
-        # Date from first message
-        if config.show_date and first_message.date:
-            formatted_date = first_message.get_formatted_date(
-                config.timezone_offset_hours
-            )
-            header_parts.append(formatted_date)
+        # Header plus each text goes straight into one growable buffer,
+        # with the same \n\n separator the list+join produced
+        buf = io.StringIO()
+        empty = True
 
-        if header_parts:
-            text_parts.append(" - ".join(header_parts))
+        def emit(part: str) -> None:
+            nonlocal empty
+            if not empty:
+                buf.write("\n\n")
+            buf.write(part)
+            empty = False
 
-        # Combine all message texts with \\n\\n separator
-        message_texts = [msg.text for msg in batch if msg.text]
-        combined_text = "\n\n".join(message_texts)
+        # Header comes from the first message only, through the formatter
+        # compiled once per run
+        header_fmt = self._header_fmt or _compile_header_formatter(config)
+        header = header_fmt(first_message)
+        if header:
+            emit(header)
 
-        if combined_text:
-            text_parts.append(combined_text)
+        for msg in batch:
+            if msg.text:
+                emit(msg.text)
 
-        return "\n\n".join(text_parts)
+        return buf.getvalue()
 
     async def _resend_message_batch(
         self,
@@ -595,6 +921,13 @@ class ResendService:
             )
             return
 
+        # Media batches go out as one grouped album RPC
+        if batch[0].has_media:
+            await self._resend_album_batch(
+                batch, target_entity, config, progress_callback
+            )
+            return
+
         # For multi-message batches, send as combined text
         # Update progress for all messages in batch
         for message in batch:
@@ -603,51 +936,86 @@ class ResendService:
 
         try:
             # Build combined message text
-            message_text = await self._build_batched_message_text(batch, config)
+            message_text = self._build_batched_message_text(batch, config)
 
             if not message_text:
                 return
 
             # Send combined text message with retry logic
-            retry_count = 0
-            while retry_count < MAX_SEND_RETRIES:
-                try:
-                    await self.telegram_service.client.send_message(
-                        entity=target_entity,
-                        message=message_text,
-                        silent=True,
-                        parse_mode="html",
-                    )
-                    self._current_progress.exported_text_messages += len(batch)
-                    logger.debug(f"Successfully sent batch of {len(batch)} messages")
-                    break  # Success, exit retry loop
+            if await self._send_with_retry(
+                lambda: self.telegram_service.client.send_message(
+                    entity=target_entity,
+                    message=message_text,
+                    silent=True,
+                    parse_mode="html",
+                ),
+                batch[0].message_id,
+                batch_size=len(batch),
+            ):
+                self._current_progress.exported_text_messages += len(batch)
+                logger.debug(f"Successfully sent batch of {len(batch)} messages")
+
+            # Batch boundaries always emit so batch counters land promptly
+            await self._maybe_emit_progress(progress_callback, force=True)
 
-                except FloodWaitError as e:
-                    retry_count += 1
-                    logger.warning(
-                        f"Rate limit hit while sending batch. "
-                        f"Telegram requires waiting {e.seconds} seconds. "
-                        f"(Retry {retry_count}/{MAX_SEND_RETRIES})"
-                    )
-                    if retry_count < MAX_SEND_RETRIES:
-                        await asyncio.sleep(e.seconds)
-                    else:
-                        logger.error(
-                            "Max retries reached for batch after rate limiting"
-                        )
-                        self._current_progress.failed_messages += len(batch)
-                        break
+        except Exception as e:
+            logger.error(f"Error resending batch: {e}")
+            self._current_progress.failed_messages += len(batch)
 
-                except Exception as e:
-                    logger.error(f"Failed to send batched text message: {e}")
-                    self._current_progress.failed_messages += len(batch)
-                    break
+    async def _resend_album_batch(
+        self,
+        batch: List[DeletedMessage],
+        target_entity,
+        config: ResendConfig,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        """
+        Resend a batch of media messages as one grouped album.
 
-            # Call progress callback
-            await self._call_progress_callback(
-                progress_callback, self._current_progress
-            )
+        Telethon dispatches a list of files as a single
+        messages.sendMultiMedia RPC, so an album of 10 costs one round
+        trip instead of 10.
+
+        Args:
+            batch: Media messages grouped by _create_message_batches
+            target_entity: Target Telegram entity
+            config: Resend configuration
+            progress_callback: Optional progress callback
+        """
+        for message in batch:
+            self._current_progress.processed_messages += 1
+            self._current_progress.current_message_id = message.message_id
+
+        try:
+            # Batch construction only admits messages with a stat-ed file
+            files = [self._media_info[m.message_id][0] for m in batch]
+
+            captions = None
+            if config.include_text:
+                captions = [
+                    safe_truncate_utf8(
+                        self._build_message_text(m, config), TELEGRAM_CAPTION_LIMIT
+                    )
+                    for m in batch
+                ]
+
+            if await self._send_with_retry(
+                lambda: self.telegram_service.client.send_file(
+                    entity=target_entity,
+                    file=files,
+                    caption=captions,
+                    silent=True,
+                    force_document=False,
+                ),
+                batch[0].message_id,
+                batch_size=len(batch),
+            ):
+                self._current_progress.exported_media_messages += len(batch)
+                logger.debug(f"Successfully sent album of {len(batch)} media files")
+
+            # Batch boundaries always emit so batch counters land promptly
+            await self._maybe_emit_progress(progress_callback, force=True)
 
         except Exception as e:
-            logger.error(f"Error resending batch: {e}")
+            logger.error(f"Error resending album: {e}")
             self._current_progress.failed_messages += len(batch)
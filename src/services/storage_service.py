@@ -2,16 +2,75 @@
 Service for file and data storage management.
 """
 
-import json
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
+
+from pydantic import TypeAdapter
 
 from ..models.config import AppConfig
 from ..models.message import DeletedMessage
 from ..utils.paths import get_config_file_path, get_user_data_directory
 
 
+# Prebuilt adapter: hydrates the whole metadata file in one pydantic-core
+# Rust pass, instead of json.loads + per-message DeletedMessage(**d)
+_DM_LIST_ADAPTER = TypeAdapter(List[DeletedMessage])
+
+# Unlink concurrency for _parallel_rmtree; deletion is I/O bound and the
+# syscalls release the GIL
+_RMTREE_WORKERS = 8
+
+# Upper bound on list_export_directories cache staleness. The mtime key
+# misses writes that happen inside an existing chat folder (the exporter
+# writes messages_metadata.json into a folder created at export start,
+# which does not touch the scan roots), so entries also expire on time.
+_LIST_CACHE_TTL = 2.0  # seconds
+
+
+def _parallel_rmtree(path: str) -> None:
+    """
+    Delete a directory tree with concurrent unlinks.
+
+    shutil.rmtree removes files one syscall at a time; for media-heavy
+    exports, spreading the unlinks over a small thread pool overlaps the
+    disk waits. Directories are removed children-first afterwards (a
+    child path is always longer than its parent's, so sorting by length
+    gives a safe order).
+
+    Args:
+        path: Directory to delete
+    """
+    if os.name != "posix":
+        shutil.rmtree(path)
+        return
+
+    files: list[str] = []
+    dirs: list[str] = []
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    if files:
+        with ThreadPoolExecutor(max_workers=_RMTREE_WORKERS) as pool:
+            # list() drains the iterator so worker exceptions surface here
+            list(pool.map(os.unlink, files))
+
+    dirs.sort(key=len, reverse=True)
+    for directory in dirs:
+        os.rmdir(directory)
+
+
 class StorageService:
     """Service for managing file storage and data persistence."""
 
@@ -26,6 +85,9 @@ class StorageService:
             self.base_directory = get_user_data_directory()
         else:
             self.base_directory = Path(base_directory)
+        # list_export_directories cache, keyed on the mtimes of the two
+        # scanned parent directories plus a short TTL (see that method)
+        self._list_cache: Optional[tuple[tuple[int, int], float, List[str]]] = None
 
     def ensure_directory(self, directory: str) -> Path:
         """
@@ -91,7 +153,8 @@ class StorageService:
         Returns:
             True if configuration file exists
         """
-        return Path(file_path).exists()
+        # Direct C-level stat, no PurePath allocation
+        return os.path.isfile(file_path)
 
     def save_messages_metadata(
         self, messages: List[DeletedMessage], directory: str
@@ -106,12 +169,12 @@ class StorageService:
         dir_path = self.ensure_directory(directory)
         metadata_file = dir_path / "messages_metadata.json"
 
-        messages_data = [msg.model_dump(mode="json") for msg in messages]
-
-        metadata_file.write_text(
-            json.dumps(messages_data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        # One pydantic-core Rust pass serializes the whole list straight
+        # to UTF-8 bytes: no per-message Python call, no intermediate
+        # dicts, and the only transient allocation is the document itself
+        metadata_file.write_bytes(_DM_LIST_ADAPTER.dump_json(messages, indent=2))
+        # A new metadata file may turn its directory into an export
+        self._list_cache = None
 
     def load_messages_metadata(self, directory: str) -> List[DeletedMessage]:
         """
@@ -131,8 +194,9 @@ class StorageService:
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
-        messages_data = json.loads(metadata_file.read_text(encoding="utf-8"))
-        return [DeletedMessage(**msg_data) for msg_data in messages_data]
+        # One pass in pydantic-core: parse and validate straight from the
+        # raw bytes, with no intermediate Python dicts or kwargs unpacking
+        return _DM_LIST_ADAPTER.validate_json(metadata_file.read_bytes())
 
     def get_export_statistics(self, directory: str) -> dict:
         """
@@ -144,9 +208,7 @@ class StorageService:
         Returns:
             Dictionary with statistics
         """
-        dir_path = Path(directory)
-
-        if not dir_path.exists():
+        if not os.path.isdir(directory):
             return {
                 "exists": False,
                 "total_messages": 0,
@@ -154,15 +216,27 @@ class StorageService:
                 "total_size_bytes": 0,
             }
 
-        # Count files using Path methods
-        files = [f for f in dir_path.glob("*") if f.is_file()]
-        total_files = len(files)
-        total_size = sum(f.stat().st_size for f in files)
-
-        # Load metadata if available
+        # Count files in one scandir pass: DirEntry answers is_file from
+        # readdir data and caches the stat, instead of a Path object and
+        # two stat syscalls per file. The metadata file is bookkeeping,
+        # not exported content, so it is sized separately rather than
+        # counted among the export's files.
+        total_files = 0
+        total_size = 0
+        metadata_size: Optional[int] = None
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    if entry.name == "messages_metadata.json":
+                        metadata_size = entry.stat(follow_symlinks=False).st_size
+                        continue
+                    total_files += 1
+                    total_size += entry.stat(follow_symlinks=False).st_size
+
+        # Load metadata if available (the scan above already told us
+        # whether it exists, so no extra stat)
         total_messages = 0
-        metadata_file = dir_path / "messages_metadata.json"
-        if metadata_file.exists():
+        if metadata_size is not None:
             try:
                 messages = self.load_messages_metadata(directory)
                 total_messages = len(messages)
@@ -175,6 +249,7 @@ class StorageService:
             "total_files": total_files,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "metadata_size_bytes": metadata_size or 0,
         }
 
     def list_export_directories(self) -> List[str]:
@@ -187,23 +262,64 @@ class StorageService:
         if not self.base_directory.exists():
             return []
 
-        export_dirs = []
-
-        # Look for metadata files in common export locations
-        # First check direct children
-        for item in self.base_directory.iterdir():
-            if item.is_dir() and (item / "messages_metadata.json").exists():
-                export_dirs.append(item.name)
+        # Creating or deleting an export bumps the parent directory's
+        # mtime, so two stats decide whether the previous scan is still
+        # valid — repeat calls from UI refreshes cost no per-child work.
+        # A metadata file appearing inside an existing folder does not
+        # bump either root, so the cache also expires after a short TTL
+        # rather than trusting the key indefinitely.
+        exported_messages_dir = os.path.join(self.base_directory, "exported_messages")
+        try:
+            base_mtime = os.stat(self.base_directory).st_mtime_ns
+        except OSError:
+            base_mtime = 0
+        try:
+            sub_mtime = os.stat(exported_messages_dir).st_mtime_ns
+        except OSError:
+            sub_mtime = 0
+        cache_key = (base_mtime, sub_mtime)
+        now = time.monotonic()
+        if (
+            self._list_cache is not None
+            and self._list_cache[0] == cache_key
+            and now < self._list_cache[1]
+        ):
+            return self._list_cache[2]
+
+        # Both scan roots share one generator; paths are relative to
+        # base_directory via the prefix
+        export_dirs = [
+            *self._scan_for_exports(self.base_directory),
+            *self._scan_for_exports(exported_messages_dir, "exported_messages/"),
+        ]
+        export_dirs.sort()
+        self._list_cache = (cache_key, now + _LIST_CACHE_TTL, export_dirs)
+        return export_dirs
+
+    @staticmethod
+    def _scan_for_exports(root, prefix: str = "") -> Iterator[str]:
+        """
+        Yield subdirectories of root that contain a metadata file.
 
-        # Also check in exported_messages subdirectory
-        exported_messages_dir = self.base_directory / "exported_messages"
-        if exported_messages_dir.exists() and exported_messages_dir.is_dir():
-            for item in exported_messages_dir.iterdir():
-                if item.is_dir() and (item / "messages_metadata.json").exists():
-                    # Return path relative to base_directory
-                    export_dirs.append(f"exported_messages/{item.name}")
+        scandir answers is_dir from readdir data (no stat per child) and
+        the metadata probe is a single isfile on a joined string, instead
+        of pathlib objects and an extra stat per subdirectory. A missing
+        root yields nothing.
 
-        return sorted(export_dirs)
+        Args:
+            root: Directory to scan
+            prefix: Prepended to each yielded name (e.g. "exported_messages/")
+        """
+        try:
+            it = os.scandir(root)
+        except FileNotFoundError:
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(
+                    os.path.join(entry.path, "messages_metadata.json")
+                ):
+                    yield prefix + entry.name
 
     def delete_export_directory(self, directory: str, *, force: bool = False) -> bool:
         """
@@ -224,11 +340,9 @@ class StorageService:
                 "Must set force=True to delete directory. This is a safety measure."
             )
 
-        dir_path = Path(directory)
-
-        if not dir_path.exists():
+        if not os.path.isdir(directory):
             return False
 
-        # Use shutil.rmtree for recursive deletion (modern approach)
-        shutil.rmtree(dir_path)
+        _parallel_rmtree(directory)
+        self._list_cache = None
         return True
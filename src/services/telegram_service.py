@@ -2,7 +2,10 @@
 Telegram API service for managing connections and chat operations.
 """
 
-from typing import Awaitable, Callable, List, Optional, Protocol
+import asyncio
+import sys
+import time
+from typing import Awaitable, Callable, Iterable, List, Optional, Protocol
 
 from telethon import TelegramClient
 from telethon.errors import RPCError, SessionPasswordNeededError
@@ -12,6 +15,40 @@ from ..models.chat import ChatInfo
 from ..models.config import TelegramConfig
 from ..utils.paths import get_session_file_path
 
+# Entity cache sizing: FIFO-evicted at this many entries so a long session
+# browsing many chats cannot grow the caches without bound
+ENTITY_CACHE_MAX = 1024
+# Failed lookups are remembered this long before the API is retried
+ENTITY_MISS_TTL = 60.0  # seconds
+# Dialog batches stay fresh this long; navigation and repeated searches
+# within the window reuse one get_dialogs call
+DIALOG_CACHE_TTL = 5.0  # seconds
+# Send-permission answers stay fresh this long (rights can change, so the
+# cache is shorter-lived than the entity cache)
+PERM_CACHE_TTL = 30.0  # seconds
+PERM_CACHE_MAX = 512
+
+# Interned chat-type literals: every ChatInfo shares the same string
+# objects, so the pydantic Literal validator compares by pointer
+_TYPE_USER = sys.intern("user")
+_TYPE_GROUP = sys.intern("group")
+_TYPE_CHANNEL = sys.intern("channel")
+_TYPE_SUPERGROUP = sys.intern("supergroup")
+
+# Clients pooled per session: constructing a TelegramClient parses the
+# SQLite session file, so reconnect cycles reuse the open handle instead
+_CLIENT_POOL: dict[tuple[str, int], TelegramClient] = {}
+
+
+async def close_client_pool() -> None:
+    """Disconnect and drop every pooled client (graceful shutdown)."""
+    for client in _CLIENT_POOL.values():
+        try:
+            await client.disconnect()
+        except Exception:
+            pass
+    _CLIENT_POOL.clear()
+
 
 class TelegramClientProtocol(Protocol):
     """Protocol for Telegram client to enable testing."""
@@ -43,6 +80,16 @@ class TelegramService:
         self._code_callback: Optional[Callable[[], Awaitable[str]]] = None
         self._password_callback: Optional[Callable[[], Awaitable[str]]] = None
         self._entity_cache: dict = {}  # Cache for get_entity calls
+        # Negative cache: {entity_id: (monotonic timestamp, exception)}
+        # so repeated lookups of dead chat IDs don't re-pay an RTT each
+        self._entity_miss: dict[int, tuple[float, Exception]] = {}
+        # {limit: (monotonic timestamp, [(lowercased title, dialog)])}
+        self._dialog_cache: dict[int, tuple[float, list]] = {}
+        # Admin-log capability per chat; listing screens re-check the
+        # same chats, so each answer is computed once per session
+        self._export_cap_cache: dict[int, bool] = {}
+        # {chat_id: (monotonic timestamp, can_send bool)}
+        self._perm_cache: dict[int, tuple[float, bool]] = {}
 
     @property
     def client(self) -> Optional[TelegramClientProtocol]:
@@ -84,11 +131,15 @@ class TelegramService:
                 # Use proper session file path for standalone builds
                 session_path = get_session_file_path(self.config.session_name)
 
-                self._client = TelegramClient(
-                    session_path,
-                    self.config.app_id,
-                    self.config.app_hash,
-                )
+                pool_key = (session_path, self.config.app_id)
+                client = _CLIENT_POOL.get(pool_key)
+                if client is None:
+                    client = _CLIENT_POOL[pool_key] = TelegramClient(
+                        session_path,
+                        self.config.app_id,
+                        self.config.app_hash,
+                    )
+                self._client = client
 
             # Connect to Telegram
             await self._client.connect()
@@ -152,7 +203,12 @@ class TelegramService:
             return {"status": "error", "message": str(e)}
 
     async def disconnect(self) -> None:
-        """Disconnect from Telegram."""
+        """Disconnect from Telegram.
+
+        The underlying client stays in the module pool with its session
+        handle open, so a later connect() resumes without re-parsing the
+        session file.
+        """
         if self._client:
             await self._client.disconnect()
             self._is_connected = False
@@ -167,9 +223,76 @@ class TelegramService:
         Returns:
             Entity object (User, Chat, or Channel)
         """
-        if entity_id not in self._entity_cache:
-            self._entity_cache[entity_id] = await self._client.get_entity(entity_id)
-        return self._entity_cache[entity_id]
+        entity = self._entity_cache.get(entity_id)
+        if entity is not None:
+            return entity
+
+        # Recently failed lookups re-raise without another RPC
+        miss = self._entity_miss.get(entity_id)
+        if miss is not None:
+            timestamp, exc = miss
+            if time.monotonic() - timestamp < ENTITY_MISS_TTL:
+                raise exc
+            del self._entity_miss[entity_id]
+
+        try:
+            entity = await self._client.get_entity(entity_id)
+        except RPCError as e:
+            if len(self._entity_miss) >= ENTITY_CACHE_MAX:
+                # Dicts iterate in insertion order, so this evicts the oldest
+                self._entity_miss.pop(next(iter(self._entity_miss)))
+            self._entity_miss[entity_id] = (time.monotonic(), e)
+            raise
+
+        if len(self._entity_cache) >= ENTITY_CACHE_MAX:
+            self._entity_cache.pop(next(iter(self._entity_cache)))
+        self._entity_cache[entity_id] = entity
+        return entity
+
+    async def prefetch_entities(self, entity_ids: Iterable[int]) -> None:
+        """
+        Warm the entity cache for a batch of IDs concurrently.
+
+        The lookups run in parallel, so N cold entities cost roughly one
+        round trip of wall time instead of N. Failures land in the
+        negative cache and are not raised here.
+
+        Args:
+            entity_ids: Entity IDs to resolve
+        """
+        pending = [i for i in entity_ids if i not in self._entity_cache]
+        if pending:
+            await asyncio.gather(
+                *(self.get_entity_cached(i) for i in pending),
+                return_exceptions=True,
+            )
+
+    async def _get_dialogs_cached(self, limit: int) -> list:
+        """
+        Get dialogs with titles pre-lowercased, cached for a short TTL.
+
+        One get_dialogs round trip serves every navigation refresh and
+        search within the TTL window, and titles are lowercased once per
+        fetch instead of once per query.
+
+        Args:
+            limit: Maximum number of dialogs to retrieve
+
+        Returns:
+            List of (lowercased title or None, title or None, dialog) tuples
+        """
+        now = time.monotonic()
+        cached = self._dialog_cache.get(limit)
+        if cached is not None and now - cached[0] < DIALOG_CACHE_TTL:
+            return cached[1]
+
+        dialogs = await self._client.get_dialogs(limit=limit)
+        pairs = []
+        for dialog in dialogs:
+            title = self._get_entity_title(dialog.entity)
+            pairs.append((title.lower() if title else None, title, dialog))
+        self._dialog_cache[limit] = (now, pairs)
+        return pairs
 
     async def get_recent_chats(self, limit: int = 20) -> List[ChatInfo]:
         """
@@ -185,12 +308,9 @@ class TelegramService:
             raise RuntimeError("Not connected to Telegram")
 
         try:
-            dialogs = await self._client.get_dialogs(limit=limit)
             chat_list = []
-
-            for dialog in dialogs:
-                entity = dialog.entity
-                chat_info = self._create_chat_info(entity, dialog)
+            for _, title, dialog in await self._get_dialogs_cached(limit):
+                chat_info = self._create_chat_info(dialog.entity, dialog, title=title)
                 if chat_info:
                     chat_list.append(chat_info)
 
@@ -213,16 +333,15 @@ class TelegramService:
             raise RuntimeError("Not connected to Telegram")
 
         try:
-            dialogs = await self._client.get_dialogs(limit=100)
             query_lower = query.lower()
             results = []
 
-            for dialog in dialogs:
-                entity = dialog.entity
-                title = self._get_entity_title(entity)
-
-                if title and query_lower in title.lower():
-                    chat_info = self._create_chat_info(entity, dialog)
+            # The cached batch carries pre-lowered titles, so repeated
+            # searches within the TTL cost no RPC and no re-lowercasing,
+            # and matches reuse the already-built title
+            for title_lower, title, dialog in await self._get_dialogs_cached(100):
+                if title_lower and query_lower in title_lower:
+                    chat_info = self._create_chat_info(dialog.entity, dialog, title=title)
                     if chat_info:
                         results.append(chat_info)
 
@@ -253,7 +372,11 @@ class TelegramService:
             raise RuntimeError(f"Failed to get chat {chat_id}: {e}")
 
     def _create_chat_info(
-        self, entity, dialog: Optional[Dialog] = None
+        self,
+        entity,
+        dialog: Optional[Dialog] = None,
+        *,
+        title: Optional[str] = None,
     ) -> Optional[ChatInfo]:
         """
         Create ChatInfo from Telegram entity.
@@ -261,34 +384,34 @@ class TelegramService:
         Args:
             entity: Telegram entity (User, Chat, or Channel)
             dialog: Optional dialog for additional info
+            title: Precomputed title (from _get_entity_title) to avoid
+                rebuilding the name string a second time
 
         Returns:
             ChatInfo object or None
         """
         chat_id = None
-        title = None
         chat_type = None
         username = None
         participant_count = None
         description = None
         last_message_date = None
 
+        if title is None:
+            title = self._get_entity_title(entity)
+
         if isinstance(entity, User):
             chat_id = entity.id
-            title = (
-                " ".join(filter(None, [entity.first_name, entity.last_name])) or "User"
-            )
-            chat_type = "user"
+            title = title or "User"
+            chat_type = _TYPE_USER
             username = entity.username
         elif isinstance(entity, Chat):
             chat_id = entity.id
-            title = entity.title
-            chat_type = "group"
+            chat_type = _TYPE_GROUP
             participant_count = getattr(entity, "participants_count", None)
         elif isinstance(entity, Channel):
             chat_id = entity.id
-            title = entity.title
-            chat_type = "channel" if entity.broadcast else "supergroup"
+            chat_type = _TYPE_CHANNEL if entity.broadcast else _TYPE_SUPERGROUP
             username = entity.username
             participant_count = getattr(entity, "participants_count", None)
         else:
@@ -297,7 +420,10 @@ class TelegramService:
         if dialog:
             last_message_date = getattr(dialog.message, "date", None)
 
-        return ChatInfo(
+        # Fields come straight from Telethon objects with the right types
+        # already, so model_construct skips the per-field validation pass
+        # that a listing of hundreds of chats would otherwise repeat
+        return ChatInfo.model_construct(
             chat_id=chat_id,
             title=title,
             chat_type=chat_type,
@@ -337,25 +463,40 @@ class TelegramService:
         if not self._is_connected or not self._client:
             return False
 
+        cached = self._export_cap_cache.get(chat_id)
+        if cached is not None:
+            return cached
+
         try:
-            entity = await self._client.get_entity(chat_id)
+            entity = await self.get_entity_cached(chat_id)
 
             # Admin logs only work for channels and supergroups
             if not isinstance(entity, Channel):
+                self._export_cap_cache[chat_id] = False
                 return False
 
-            # Best way to check: actually try to access the admin log with limit=1
-            # This is more reliable than checking permissions, as permission flags
-            # can be inconsistent or missing
+            # get_entity already reports our admin rights on the channel;
+            # any admin can read the admin log, so a set flag answers the
+            # question without the probe RPC below
+            admin_rights = getattr(entity, "admin_rights", None)
+            if admin_rights is not None or getattr(entity, "creator", False):
+                self._export_cap_cache[chat_id] = True
+                return True
+
+            # Ambiguous (no rights reported): actually try to access the
+            # admin log with limit=1, which is more reliable than
+            # permission flags that can be inconsistent or missing
             try:
                 # Try to get one admin log entry
                 async for _ in self._client.iter_admin_log(entity, limit=1):
                     # If we get here, we have access
-                    return True
-                # If no entries but no error, we still have access (just empty log)
+                    break
+                # No entries but no error still means access (empty log)
+                self._export_cap_cache[chat_id] = True
                 return True
             except Exception:
                 # If we get an error trying to access the log, we don't have permission
+                self._export_cap_cache[chat_id] = False
                 return False
 
         except Exception:
@@ -375,39 +516,51 @@ class TelegramService:
         if not self._is_connected or not self._client:
             return False
 
-        try:
-            entity = await self._client.get_entity(chat_id)
+        cached = self._perm_cache.get(chat_id)
+        if cached is not None and time.monotonic() - cached[0] < PERM_CACHE_TTL:
+            return cached[1]
 
-            # Get user's permissions
-            permissions = await self._client.get_permissions(entity)
+        try:
+            # Both lookups are independent RPCs; overlapping them roughly
+            # halves the wall time of a cold check
+            entity, permissions = await asyncio.gather(
+                self.get_entity_cached(chat_id),
+                self._client.get_permissions(chat_id),
+            )
 
             # Check if user can send messages based on entity type
             if isinstance(entity, User):
                 # Can always send to users (private chats)
-                return True
+                allowed = True
 
             elif isinstance(entity, Chat):
                 # For regular groups, check if user is still a member
                 # send_messages defaults to True for members
                 if getattr(permissions, "has_left", False):
-                    return False
-                return getattr(permissions, "send_messages", True)
+                    allowed = False
+                else:
+                    allowed = getattr(permissions, "send_messages", True)
 
             elif isinstance(entity, Channel):
                 # For channels/supergroups, check permissions
                 if entity.broadcast:
                     # It's a broadcast channel - need post_messages right
-                    return getattr(permissions, "post_messages", False)
+                    allowed = getattr(permissions, "post_messages", False)
+                elif getattr(permissions, "send_messages", None) is False:
+                    # It's a supergroup and the user is banned/restricted
+                    allowed = False
                 else:
-                    # It's a supergroup - regular members can usually send
-                    # Check if user is banned/restricted first
-                    if getattr(permissions, "send_messages", None) is False:
-                        return False
-                    # If send_messages is True or None (default allowed), they can send
-                    return getattr(permissions, "send_messages", True)
+                    # send_messages True or None (default allowed)
+                    allowed = getattr(permissions, "send_messages", True)
 
-            return False
+            else:
+                allowed = False
 
         except Exception:
             # If we can't check permissions, assume False for safety
             return False
+
+        if len(self._perm_cache) >= PERM_CACHE_MAX:
+            self._perm_cache.pop(next(iter(self._perm_cache)))
+        self._perm_cache[chat_id] = (time.monotonic(), allowed)
+        return allowed
@@ -2,29 +2,47 @@
 Main Flet application.
 """
 
-from typing import Optional
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional
 
 import flet as ft
 
 from ..models.chat import ChatInfo
-from ..models.config import ExportConfig, ResendConfig, TelegramConfig
+from ..models.config import AppConfig, ExportConfig, ResendConfig, TelegramConfig
 from ..models.message import ExportProgress
 from ..services.export_service import ExportService
 from ..services.resend_service import ResendService
 from ..services.storage_service import StorageService
 from ..services.telegram_service import TelegramService
-from .screens.chat_select_screen import ChatSelectScreen
-from .screens.code_auth_screen import CodeAuthScreen
-from .screens.config_screen import ConfigScreen
-from .screens.export_config_screen import ExportConfigScreen
-from .screens.password_auth_screen import PasswordAuthScreen
-from .screens.phone_auth_screen import PhoneAuthScreen
-from .screens.progress_screen import ProgressScreen
-from .screens.resend_config_screen import ResendConfigScreen
 from ..utils.logger import get_logger
 
+# Screen modules are imported lazily inside the _show_* methods: cold
+# start only ever needs one of them, and after the first import the rest
+# cost a sys.modules lookup.
+
+if TYPE_CHECKING:
+    from .screens.progress_screen import ProgressScreen
+
 logger = get_logger(__name__)
 
+# Menu button styles are immutable; module constants avoid re-allocating
+# the style dicts on every menu build
+_EXPORT_BTN_STYLE = ft.ButtonStyle(
+    color=ft.Colors.WHITE,
+    bgcolor=ft.Colors.BLUE_700,
+)
+_RESEND_BTN_STYLE = ft.ButtonStyle(
+    color=ft.Colors.WHITE,
+    bgcolor=ft.Colors.PURPLE_700,
+)
+
+# Minimum spacing between progress-screen repaints; the services throttle
+# their callbacks at 0.1s, this is a second line of defense for bursts
+# (batch boundaries, forced emits)
+_PROGRESS_UI_INTERVAL = 0.05
+
 
 class TelegramApp:
     """Main application class."""
@@ -54,26 +72,96 @@ class TelegramApp:
         self.export_service: Optional[ExportService] = None
         self.resend_service: Optional[ResendService] = None
 
-        # Configuration
-        self.app_config = self.storage_service.load_config()
+        # Configuration is read from disk asynchronously in _initialize,
+        # so window creation is not gated on file I/O
+        self.app_config: Optional[AppConfig] = None
 
         # State
+        # Strong refs to in-flight background tasks: run_task returns a
+        # task the event loop only holds weakly, so an untracked task can
+        # be garbage-collected mid-flight
+        self._bg_tasks: set[asyncio.Task] = set()
         self.current_screen: Optional[ft.Control] = None
+        self._main_menu_control: Optional[ft.Control] = None
+        # Depth of nested _transition blocks; >0 suppresses intermediate
+        # page.update() calls so a compound navigation paints once
+        self._transition_depth = 0
         self.selected_chat: Optional[ChatInfo] = None
         self.selected_resend_chat: Optional[ChatInfo] = None
         self.auth_phone: Optional[str] = None  # Store phone during auth flow
+        # In-flight authenticate call; cancelled when the user navigates
+        # back so a slow network round trip cannot resolve into a screen
+        # the user already left
+        self._auth_task: Optional[asyncio.Task] = None
+
+        # Progress coalescing state (see _update_progress)
+        self._last_progress_ts = 0.0
+        self._pending_progress: Optional[tuple["ProgressScreen", ExportProgress]] = (
+            None
+        )
+        self._progress_flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # One reusable error dialog, appended to the overlay exactly once;
+        # _show_error_dialog only mutates its texts. The old per-error
+        # AlertDialog was never removed from page.overlay, so the overlay
+        # list grew for the lifetime of the session.
+        self._error_dialog = ft.AlertDialog(
+            title=ft.Text(""),
+            content=ft.Text(""),
+            actions=[ft.TextButton("OK", on_click=self._close_error_dialog)],
+        )
+        self.page.overlay.append(self._error_dialog)
 
         # Initialize
         self._initialize()
 
     def _initialize(self):
         """Initialize the application."""
-        # Show appropriate first screen
+        # Paint a lightweight placeholder immediately, then load the
+        # config on a worker thread and route to the first real screen
+        self._set_content(
+            ft.Container(
+                content=ft.ProgressRing(),
+                expand=True,
+                alignment=ft.alignment.center,
+            )
+        )
+        self._spawn(self._load_config_and_route)
+
+    async def _load_config_and_route(self):
+        """Load configuration off the event loop and show the first screen."""
+        self.app_config = await asyncio.to_thread(self.storage_service.load_config)
+
         if not self.app_config.telegram.is_valid():
             self._show_config_screen()
         else:
             # Try to connect and show main menu
-            self.page.run_task(self._connect_and_show_menu)
+            await self._connect_and_show_menu()
+
+    def _spawn(self, handler, *args) -> asyncio.Task:
+        """
+        Run a coroutine function as a tracked background task.
+
+        Args:
+            handler: Coroutine function to run on the page's event loop
+            *args: Arguments passed to the handler
+
+        Returns:
+            The created task
+        """
+        task = self.page.run_task(handler, *args)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+        return task
+
+    def _on_bg_task_done(self, task: asyncio.Task):
+        """Drop the strong ref and log unexpected failures."""
+        self._bg_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"Background task failed: {exc}")
 
     async def _connect_and_show_menu(self):
         """Connect to Telegram and show main menu."""
@@ -92,15 +180,18 @@ class TelegramApp:
                 self._show_phone_auth_screen()
 
         except Exception as e:
-            # Show error and go back to config
-            self._show_error_dialog(
-                "Connection Failed",
-                f"Failed to connect to Telegram: {str(e)}\n\nPlease check your API credentials.",
-            )
-            self._show_config_screen()
+            # Show error and go back to config, painted as one update
+            with self._transition():
+                self._show_error_dialog(
+                    "Connection Failed",
+                    f"Failed to connect to Telegram: {str(e)}\n\nPlease check your API credentials.",
+                )
+                self._show_config_screen()
 
     def _show_phone_auth_screen(self):
         """Show phone authentication screen."""
+        from .screens.phone_auth_screen import PhoneAuthScreen
+
         self._clear_content()
         screen = PhoneAuthScreen(
             on_phone_submitted=self._on_phone_submitted,
@@ -111,6 +202,7 @@ class TelegramApp:
     async def _on_phone_submitted(self, phone: str):
         """Handle phone number submitted."""
         self.auth_phone = phone
+        self._auth_task = asyncio.current_task()
         try:
             # Send verification code
             result = await self.telegram_service.authenticate(phone=phone)
@@ -123,15 +215,22 @@ class TelegramApp:
                     "Error",
                     f"Failed to send code: {result.get('message', 'Unknown error')}",
                 )
+        except asyncio.CancelledError:
+            return  # User navigated back mid-request
         except Exception as e:
             self._show_error_dialog("Error", f"Failed to send code: {str(e)}")
+        finally:
+            self._auth_task = None
 
     async def _on_phone_auth_back(self):
         """Handle back from phone auth."""
+        self._cancel_auth_task()
         self._show_config_screen()
 
     def _show_code_auth_screen(self, phone: str):
         """Show code verification screen."""
+        from .screens.code_auth_screen import CodeAuthScreen
+
         self._clear_content()
         screen = CodeAuthScreen(
             phone=phone,
@@ -142,6 +241,7 @@ class TelegramApp:
 
     async def _on_code_submitted(self, code: str):
         """Handle verification code submitted."""
+        self._auth_task = asyncio.current_task()
         try:
             # Sign in with code
             result = await self.telegram_service.authenticate(
@@ -161,15 +261,22 @@ class TelegramApp:
                     "Error",
                     f"Failed to verify code: {result.get('message', 'Unknown error')}",
                 )
+        except asyncio.CancelledError:
+            return  # User navigated back mid-request
         except Exception as e:
             self._show_error_dialog("Error", f"Failed to verify code: {str(e)}")
+        finally:
+            self._auth_task = None
 
     async def _on_code_auth_back(self):
         """Handle back from code auth."""
+        self._cancel_auth_task()
         self._show_phone_auth_screen()
 
     def _show_password_auth_screen(self):
         """Show 2FA password screen."""
+        from .screens.password_auth_screen import PasswordAuthScreen
+
         self._clear_content()
         screen = PasswordAuthScreen(
             on_password_submitted=self._on_password_submitted,
@@ -179,6 +286,7 @@ class TelegramApp:
 
     async def _on_password_submitted(self, password: str):
         """Handle 2FA password submitted."""
+        self._auth_task = asyncio.current_task()
         try:
             # Sign in with password
             result = await self.telegram_service.authenticate(password=password)
@@ -193,15 +301,29 @@ class TelegramApp:
                     "Error",
                     f"Failed to verify password: {result.get('message', 'Incorrect password')}",
                 )
+        except asyncio.CancelledError:
+            return  # User navigated back mid-request
         except Exception as e:
             self._show_error_dialog("Error", f"Failed to verify password: {str(e)}")
+        finally:
+            self._auth_task = None
 
     async def _on_password_auth_back(self):
         """Handle back from password auth."""
+        self._cancel_auth_task()
         self._show_code_auth_screen(self.auth_phone)
 
+    def _cancel_auth_task(self):
+        """Cancel an in-flight authenticate call, if any."""
+        task = self._auth_task
+        self._auth_task = None
+        if task is not None and not task.done():
+            task.cancel()
+
     def _show_config_screen(self):
         """Show API configuration screen."""
+        from .screens.config_screen import ConfigScreen
+
         self._clear_content()
         screen = ConfigScreen(
             config=self.app_config.telegram,
@@ -212,7 +334,8 @@ class TelegramApp:
     async def _on_config_saved(self, config: TelegramConfig):
         """Handle configuration saved."""
         self.app_config.telegram = config
-        self.storage_service.save_config(self.app_config)
+        # Disk write off the event loop so the UI stays responsive
+        await asyncio.to_thread(self.storage_service.save_config, self.app_config)
 
         # Connect and proceed
         await self._connect_and_show_menu()
@@ -220,7 +343,14 @@ class TelegramApp:
     def _show_main_menu(self):
         """Show main menu screen."""
         self._clear_content()
-
+        # The menu is static, so it is built once and reattached on every
+        # visit instead of rebuilding the whole control tree
+        if self._main_menu_control is None:
+            self._main_menu_control = self._build_main_menu()
+        self._set_content(self._main_menu_control)
+
+    def _build_main_menu(self) -> ft.Control:
+        """Build the main menu control tree (done once per session)."""
         # Build menu with improved spacing and layout
         menu = ft.Column(
             [
@@ -240,46 +370,54 @@ class TelegramApp:
                 ft.ElevatedButton(
                     "Export Deleted Messages",
                     icon=ft.Icons.DOWNLOAD,
-                    on_click=lambda _: self._show_export_chat_select(),
+                    on_click=self._on_menu_export_clicked,
                     width=280,
                     height=55,
-                    style=ft.ButtonStyle(
-                        color=ft.Colors.WHITE,
-                        bgcolor=ft.Colors.BLUE_700,
-                    ),
+                    style=_EXPORT_BTN_STYLE,
                 ),
                 ft.ElevatedButton(
                     "Re-send Exported Messages",
                     icon=ft.Icons.SEND,
-                    on_click=lambda _: self._show_resend_chat_select(),
+                    on_click=self._on_menu_resend_clicked,
                     width=280,
                     height=55,
-                    style=ft.ButtonStyle(
-                        color=ft.Colors.WHITE,
-                        bgcolor=ft.Colors.PURPLE_700,
-                    ),
+                    style=_RESEND_BTN_STYLE,
                 ),
                 ft.Divider(height=10),
                 ft.TextButton(
                     "Change API Configuration",
                     icon=ft.Icons.SETTINGS,
-                    on_click=lambda _: self._show_config_screen(),
+                    on_click=self._on_menu_config_clicked,
                 ),
             ],
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             spacing=15,
         )
 
-        container = ft.Container(
+        return ft.Container(
             content=menu,
             expand=True,
             alignment=ft.alignment.center,
         )
 
-        self._set_content(container)
+    # Bound-method handlers for the cached main menu: stable references
+    # instead of fresh lambda closures per build
+    def _on_menu_export_clicked(self, e):
+        """Handle main menu export button click."""
+        self._show_export_chat_select()
+
+    def _on_menu_resend_clicked(self, e):
+        """Handle main menu resend button click."""
+        self._show_resend_chat_select()
+
+    def _on_menu_config_clicked(self, e):
+        """Handle main menu configuration button click."""
+        self._show_config_screen()
 
     def _show_export_chat_select(self):
         """Show chat selection for export."""
+        from .screens.chat_select_screen import ChatSelectScreen
+
         self._clear_content()
         screen = ChatSelectScreen(
             telegram_service=self.telegram_service,
@@ -297,6 +435,8 @@ class TelegramApp:
 
     def _show_export_config_screen(self):
         """Show export configuration screen."""
+        from .screens.export_config_screen import ExportConfigScreen
+
         self._clear_content()
         screen = ExportConfigScreen(
             chat=self.selected_chat,
@@ -308,8 +448,14 @@ class TelegramApp:
 
     async def _on_start_export(self, config: ExportConfig):
         """Start export process."""
+        from .screens.progress_screen import ProgressScreen
+
         self.app_config.export = config
-        self.storage_service.save_config(self.app_config)
+        # Persist the config on a worker thread while the progress screen
+        # renders; awaited below so the export starts from saved state
+        save_task = asyncio.create_task(
+            asyncio.to_thread(self.storage_service.save_config, self.app_config)
+        )
 
         # Show progress screen
         progress_screen = ProgressScreen(
@@ -321,6 +467,7 @@ class TelegramApp:
 
         # Start export
         try:
+            await save_task
             await self.export_service.export_deleted_messages(
                 config=config,
                 progress_callback=lambda p: self._update_progress(progress_screen, p),
@@ -341,6 +488,8 @@ class TelegramApp:
 
     def _show_resend_chat_select(self):
         """Show chat selection for resend."""
+        from .screens.chat_select_screen import ChatSelectScreen
+
         self._clear_content()
         screen = ChatSelectScreen(
             telegram_service=self.telegram_service,
@@ -358,6 +507,8 @@ class TelegramApp:
 
     def _show_resend_config_screen(self):
         """Show resend configuration screen."""
+        from .screens.resend_config_screen import ResendConfigScreen
+
         self._clear_content()
         screen = ResendConfigScreen(
             target_chat=self.selected_resend_chat,
@@ -370,8 +521,14 @@ class TelegramApp:
 
     async def _on_start_resend(self, config: ResendConfig):
         """Start resend process."""
+        from .screens.progress_screen import ProgressScreen
+
         self.app_config.resend = config
-        self.storage_service.save_config(self.app_config)
+        # Persist the config on a worker thread while the progress screen
+        # renders; awaited below so the resend starts from saved state
+        save_task = asyncio.create_task(
+            asyncio.to_thread(self.storage_service.save_config, self.app_config)
+        )
 
         # Show progress screen
         progress_screen = ProgressScreen(
@@ -384,6 +541,7 @@ class TelegramApp:
 
         # Start resend
         try:
+            await save_task
             await self.resend_service.resend_messages(
                 config=config,
                 progress_callback=lambda p: self._update_progress(progress_screen, p),
@@ -408,10 +566,65 @@ class TelegramApp:
         if self.resend_service:
             self.resend_service.cancel()
 
-    def _update_progress(self, screen: ProgressScreen, progress: ExportProgress):
-        """Update progress screen."""
+    def _update_progress(self, screen: "ProgressScreen", progress: ExportProgress):
+        """
+        Update progress screen, coalescing bursts of callbacks.
+
+        Terminal snapshots (completion or error) paint immediately;
+        intermediate ones paint at most every _PROGRESS_UI_INTERVAL
+        seconds, with the newest suppressed snapshot flushed by a single
+        trailing timer so the display never sticks on a stale value.
+        """
+        now = time.monotonic()
+        if (
+            progress.is_complete
+            or progress.error_message
+            or now - self._last_progress_ts >= _PROGRESS_UI_INTERVAL
+        ):
+            if self._progress_flush_handle is not None:
+                self._progress_flush_handle.cancel()
+                self._progress_flush_handle = None
+            self._pending_progress = None
+            self._last_progress_ts = now
+            screen.update_progress(progress)
+            return
+
+        # Too soon: remember the latest snapshot and arm one flush timer
+        self._pending_progress = (screen, progress)
+        if self._progress_flush_handle is None:
+            delay = _PROGRESS_UI_INTERVAL - (now - self._last_progress_ts)
+            self._progress_flush_handle = asyncio.get_running_loop().call_later(
+                delay, self._flush_pending_progress
+            )
+
+    def _flush_pending_progress(self):
+        """Paint the most recent coalesced progress snapshot."""
+        self._progress_flush_handle = None
+        if self._pending_progress is None:
+            return
+        screen, progress = self._pending_progress
+        self._pending_progress = None
+        self._last_progress_ts = time.monotonic()
         screen.update_progress(progress)
 
+    @contextmanager
+    def _transition(self):
+        """
+        Batch page mutations into a single renderer update.
+
+        Everything inside the block mutates page state without pushing
+        updates; one page.update() goes out when the outermost block
+        exits, so compound navigations (e.g. error dialog plus screen
+        swap) cost one round trip to the Flet client instead of several.
+        """
+        self._transition_depth += 1
+        try:
+            yield
+        finally:
+            self._transition_depth -= 1
+            if self._transition_depth == 0:
+                self.page.update()
+
     def _clear_content(self):
         """Clear page content."""
         self.page.controls.clear()
@@ -420,20 +633,23 @@ class TelegramApp:
     def _set_content(self, control: ft.Control):
         """Set page content."""
         self.current_screen = control
-        self.page.add(control)
-        self.page.update()
+        # Append directly: page.add would push its own update, doubling
+        # the renderer round trips on every transition
+        self.page.controls.append(control)
+        if self._transition_depth == 0:
+            self.page.update()
 
     def _show_error_dialog(self, title: str, message: str):
-        """Show error dialog."""
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("OK", on_click=lambda _: self.page.close(dialog)),
-            ],
-        )
-        self.page.overlay.append(dialog)
-        dialog.open = True
+        """Show error dialog (reuses the session-wide dialog instance)."""
+        self._error_dialog.title.value = title
+        self._error_dialog.content.value = message
+        self._error_dialog.open = True
+        if self._transition_depth == 0:
+            self.page.update()
+
+    def _close_error_dialog(self, e):
+        """Handle OK click on the error dialog."""
+        self._error_dialog.open = False
         self.page.update()
 
 
@@ -2,6 +2,8 @@
 Chat list item component.
 """
 
+from typing import ClassVar
+
 import flet as ft
 
 from ...models.chat import ChatInfo
@@ -10,6 +12,28 @@ from ...models.chat import ChatInfo
 class ChatListItem(ft.Container):
     """Component for displaying a chat item in a list."""
 
+    # Shared across all items; building a fresh dict per row only churned
+    # the allocator on long chat lists
+    _ICON_MAP: ClassVar[dict[str, str]] = {
+        "channel": ft.Icons.CAMPAIGN,
+        "group": ft.Icons.GROUP,
+        "supergroup": ft.Icons.GROUPS,
+        "user": ft.Icons.PERSON,
+        "chat": ft.Icons.CHAT,
+    }
+
+    # Style values shared by every row. The border object is read-only
+    # after construction, so one instance serves all items; the enum
+    # lookups are resolved once instead of per row.
+    _BORDER: ClassVar[ft.Border] = ft.border.all(1, ft.Colors.GREY_300)
+    _CHEVRON_ICON: ClassVar[str] = ft.Icons.CHEVRON_RIGHT
+    _CHEVRON_COLOR: ClassVar[str] = ft.Colors.GREY_400
+
+    @classmethod
+    def _make_chevron(cls) -> ft.Icon:
+        """Build the trailing chevron (controls cannot be shared between rows)."""
+        return ft.Icon(cls._CHEVRON_ICON, color=cls._CHEVRON_COLOR)
+
     def __init__(self, chat: ChatInfo, on_click):
         """
         Initialize chat list item.
@@ -28,14 +52,7 @@ class ChatListItem(ft.Container):
     def _build_ui(self):
         """Build the UI layout."""
         # Chat icon based on type
-        icon_map = {
-            "channel": ft.Icons.CAMPAIGN,
-            "group": ft.Icons.GROUP,
-            "supergroup": ft.Icons.GROUPS,
-            "user": ft.Icons.PERSON,
-            "chat": ft.Icons.CHAT,
-        }
-        icon = icon_map.get(self.chat.chat_type, ft.Icons.CHAT)
+        icon = self._ICON_MAP.get(self.chat.chat_type, ft.Icons.CHAT)
 
         # Build content
         content = ft.Row(
@@ -49,33 +66,12 @@ class ChatListItem(ft.Container):
                             weight=ft.FontWeight.BOLD,
                             overflow=ft.TextOverflow.ELLIPSIS,
                         ),
-                        ft.Row(
-                            [
-                                ft.Text(
-                                    self.chat.chat_type_display,
-                                    size=12,
-                                    color=ft.Colors.GREY_600,
-                                ),
-                                ft.Text(
-                                    f"@{self.chat.username}"
-                                    if self.chat.username
-                                    else "",
-                                    size=12,
-                                    color=ft.Colors.GREY_500,
-                                ),
-                                ft.Text(
-                                    f"ID: {self.chat.chat_id}",
-                                    size=12,
-                                    color=ft.Colors.GREY_500,
-                                ),
-                            ],
-                            spacing=10,
-                        ),
+                        ft.Row(self._build_detail_texts(), spacing=10),
                     ],
                     spacing=5,
                     expand=True,
                 ),
-                ft.Icon(ft.Icons.CHEVRON_RIGHT, color=ft.Colors.GREY_400),
+                self._make_chevron(),
             ],
             spacing=15,
             alignment=ft.MainAxisAlignment.START,
@@ -83,7 +79,7 @@ class ChatListItem(ft.Container):
 
         self.content = content
         self.padding = 15
-        self.border = ft.border.all(1, ft.Colors.GREY_300)
+        self.border = self._BORDER
         self.border_radius = 8
         self.ink = True
         self.on_click = self._handle_click
@@ -92,6 +88,24 @@ class ChatListItem(ft.Container):
         self.bgcolor = ft.Colors.WHITE
         self.on_hover = self._on_hover
 
+    def _build_detail_texts(self) -> list:
+        """Build the secondary detail row: type, optional username, ID.
+
+        Chats without a username get two controls instead of three — no
+        empty Text placeholder to create, serialize, and lay out.
+        """
+        parts = [
+            ft.Text(self.chat.chat_type_display, size=12, color=ft.Colors.GREY_600),
+        ]
+        if self.chat.username:
+            parts.append(
+                ft.Text("@" + self.chat.username, size=12, color=ft.Colors.GREY_500)
+            )
+        parts.append(
+            ft.Text("ID: " + str(self.chat.chat_id), size=12, color=ft.Colors.GREY_500)
+        )
+        return parts
+
     async def _handle_click(self, e):
         """Handle click event."""
         if self.on_click_callback:
@@ -3,9 +3,11 @@ Path utilities for handling file locations in standalone builds.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_app_directory() -> Path:
     """
     Get the application directory.
@@ -15,6 +17,10 @@ def get_app_directory() -> Path:
     - When run as PyInstaller bundle: the directory containing the executable
     - When run as macOS .app: the Resources directory inside the bundle
 
+    The result is cached: frozen-ness and the bundle layout never change
+    within a process (and from source the app does not chdir), so every
+    caller after the first gets the same Path back for free.
+
     Returns:
         Path object pointing to the app directory
     """
@@ -33,6 +39,7 @@ def get_app_directory() -> Path:
     return app_path
 
 
+@lru_cache(maxsize=8)
 def get_session_file_path(session_name: str = "telegram_session") -> str:
     """
     Get the full path for a Telethon session file.
@@ -48,6 +55,7 @@ def get_session_file_path(session_name: str = "telegram_session") -> str:
     return str(session_path)
 
 
+@lru_cache(maxsize=8)
 def get_config_file_path(config_name: str = "app_config.json") -> str:
     """
     Get the full path for the config file.
@@ -75,6 +83,7 @@ def ensure_app_directory() -> Path:
     return app_dir
 
 
+@lru_cache(maxsize=1)
 def get_user_data_directory() -> Path:
     """
     Get the user data directory for exports and user-generated content.
@@ -88,6 +97,9 @@ def get_user_data_directory() -> Path:
     - Linux: ~/Documents/TelegramDeletedMessagesManager/
     - Development mode: project root directory
 
+    Cached after the first call, which also performs the one mkdir the
+    directory needs per process.
+
     Returns:
         Path object pointing to the user data directory
     """